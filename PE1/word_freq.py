@@ -0,0 +1,128 @@
+import argparse
+import heapq
+import mmap
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# exWords from PE1.counterW
+STOP_WORDS = frozenset({
+    'and', 'but', 'or', 'nor', 'for', 'so', 'yet', 'a', 'an', 'the', 'of'
+})
+BLOCK_CHARS = 1024 * 1024
+CHUNK_BYTES = 16 * 1024 * 1024
+ASCII_WHITESPACE = b" \t\n\r\x0b\x0c"
+
+
+def count_words(words, counts=None):
+    """Add words to a Counter, skipping stop words (case-insensitive)"""
+    counts = Counter() if counts is None else counts
+    stop = STOP_WORDS
+    counts.update(word for word in words if word.lower() not in stop)
+    return counts
+
+
+def count_text(text, counts=None):
+    return count_words(text.split(), counts)
+
+
+def count_stream(file, block_chars=BLOCK_CHARS):
+    """Count a text file object block by block, never holding more than one block"""
+    counts = Counter()
+    carry = ""
+    while True:
+        block = file.read(block_chars)
+        if not block:
+            break
+        block = carry + block
+        # the last word may continue in the next block
+        words = block.split()
+        if words and not block[-1].isspace():
+            carry = words.pop()
+        else:
+            carry = ""
+        count_words(words, counts)
+    if carry:
+        count_words([carry], counts)
+    return counts
+
+
+def chunk_ranges(filename, chunk_bytes=CHUNK_BYTES):
+    """Split a file into (start, end) byte ranges that end just after whitespace"""
+    size = os.path.getsize(filename)
+    if size == 0:
+        return []
+    ranges = []
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            while end < size and mm[end - 1] not in ASCII_WHITESPACE:
+                end += 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def count_range(filename, start, end):
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode()
+    return count_text(text)
+
+
+def count_file(filename, workers=1, chunk_bytes=CHUNK_BYTES):
+    """Word counts for a whole file, merged from chunks counted in worker processes"""
+    if workers <= 1:
+        with open(filename, "r", encoding="utf-8") as file:
+            return count_stream(file)
+    counts = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for start, end in chunk_ranges(filename, chunk_bytes):
+            pending.append(pool.submit(count_range, filename, start, end))
+            if len(pending) >= workers * 2:
+                counts.update(pending.pop(0).result())
+        for future in pending:
+            counts.update(future.result())
+    return counts
+
+
+def report_lines(counts):
+    """The counterW output: lowercase words, then capitalized words, then the total"""
+    lowSorted = sorted((word, count) for word, count in counts.items() if word.islower())
+    upSorted = sorted((word, count) for word, count in counts.items() if word[0].isupper())
+    for word, count in lowSorted:
+        yield f"{word.ljust(10)} - {count}"
+    for word, count in upSorted:
+        yield f"{word.ljust(10)} - {count}"
+    yield f"Total words filtered: {sum(counts.values())}"
+
+
+def top_lines(counts, k):
+    """The k most frequent words, most frequent first (ties alphabetical)"""
+    top = heapq.nsmallest(k, counts.items(), key=lambda item: (-item[1], item[0]))
+    for word, count in top:
+        yield f"{word.ljust(10)} - {count}"
+    yield f"Total words filtered: {sum(counts.values())}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count words in a text file, skipping stop words")
+    parser.add_argument("file", nargs="?", help="text file (default: stdin)")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="worker processes for file chunks")
+    parser.add_argument("-k", "--top", type=int, default=None, help="only show the k most frequent words")
+    args = parser.parse_args(argv)
+
+    if args.file:
+        counts = count_file(args.file, args.workers)
+    else:
+        counts = count_stream(sys.stdin)
+
+    lines = top_lines(counts, args.top) if args.top else report_lines(counts)
+    for line in lines:
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import argparse
+import gzip
+import heapq
+import json
+import os
+from collections import Counter
+
+from word_freq import STOP_WORDS, count_file, count_text
+
+INDEX_FILE = "word_index.json.gz"
+SNAPSHOT_VERSION = 1
+
+
+class WordIndex:
+    """Word counts that can grow document by document and be saved/merged"""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.documents = {}  # document name -> words counted from it
+        self._ranked = None
+
+    def add_counts(self, name, counts):
+        """Add the word counts of one document (each document only once)"""
+        if name in self.documents:
+            raise ValueError(f"Document already indexed: {name}")
+        self.counts.update(counts)
+        self.documents[name] = sum(counts.values())
+        self._ranked = None
+
+    def add_text(self, name, text):
+        self.add_counts(name, count_text(text))
+
+    def add_file(self, filename, workers=1):
+        name = os.path.abspath(filename)
+        if name in self.documents:
+            raise ValueError(f"Document already indexed: {name}")
+        self.add_counts(name, count_file(filename, workers))
+
+    def merge(self, other):
+        """Merge another index (e.g. a shard built elsewhere) into this one"""
+        overlap = self.documents.keys() & other.documents.keys()
+        if overlap:
+            raise ValueError(f"Documents in both indexes: {', '.join(sorted(overlap))}")
+        self.counts.update(other.counts)
+        self.documents.update(other.documents)
+        self._ranked = None
+
+    def count(self, word):
+        """How many times word was seen (stop words are never counted)"""
+        return self.counts.get(word, 0)
+
+    def ranked(self):
+        """All (word, count) pairs, most frequent first, ties alphabetical"""
+        if self._ranked is None:
+            self._ranked = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return self._ranked
+
+    def top(self, n):
+        if self._ranked is not None:
+            return self._ranked[:n]
+        return heapq.nsmallest(n, self.counts.items(), key=lambda item: (-item[1], item[0]))
+
+    def total(self):
+        return sum(self.documents.values())
+
+    def save(self, filename=INDEX_FILE):
+        """Write a gzip JSON snapshot, words already in rank order"""
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "documents": self.documents,
+            "words": self.ranked(),
+        }
+        tmp = filename + ".tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as file:
+            json.dump(snapshot, file, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp, filename)
+
+    @classmethod
+    def load(cls, filename=INDEX_FILE):
+        """Read a snapshot written by save(), or an empty index if there is none"""
+        index = cls()
+        if not os.path.exists(filename):
+            return index
+        with gzip.open(filename, "rt", encoding="utf-8") as file:
+            snapshot = json.load(file)
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported index version: {snapshot.get('version')}")
+        index.documents = snapshot["documents"]
+        ranked = [(word, count) for word, count in snapshot["words"]]
+        index.counts = Counter(dict(ranked))
+        index._ranked = ranked
+        return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Persistent word-count index")
+    parser.add_argument("-i", "--index", default=INDEX_FILE, help="snapshot file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="index text files")
+    add.add_argument("files", nargs="+")
+    add.add_argument("-w", "--workers", type=int, default=1)
+
+    merge = commands.add_parser("merge", help="merge other index snapshots into this one")
+    merge.add_argument("shards", nargs="+")
+
+    count = commands.add_parser("count", help="count of a word")
+    count.add_argument("words", nargs="+")
+
+    top = commands.add_parser("top", help="most frequent words")
+    top.add_argument("n", type=int, nargs="?", default=10)
+
+    args = parser.parse_args(argv)
+    index = WordIndex.load(args.index)
+
+    if args.command == "add":
+        for filename in args.files:
+            try:
+                index.add_file(filename, args.workers)
+                print(f"Indexed {filename}")
+            except (OSError, ValueError) as e:
+                print(f"Skipping: {e}")
+        index.save(args.index)
+    elif args.command == "merge":
+        for shard in args.shards:
+            if not os.path.exists(shard):
+                # load() gives an empty index for a new file, a shard must exist
+                print(f"Skipping {shard}: no such file")
+                continue
+            try:
+                index.merge(WordIndex.load(shard))
+                print(f"Merged {shard}")
+            except (OSError, ValueError) as e:
+                print(f"Skipping {shard}: {e}")
+        index.save(args.index)
+    elif args.command == "count":
+        for word in args.words:
+            note = " (stop word)" if word.lower() in STOP_WORDS else ""
+            print(f"{word.ljust(10)} - {index.count(word)}{note}")
+    elif args.command == "top":
+        for word, n in index.top(args.n):
+            print(f"{word.ljust(10)} - {n}")
+        print(f"Total words filtered: {index.total()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,12 @@ import tkinter as tk
 from tkinter import messagebox, ttk, PhotoImage, font as tkfont
 import json
 import os
+import sys
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instrument import timed, timer  # no-ops unless PERF_INSTRUMENT is set
+
 # Constants
 RECORDS_FILE = "records.json"
 THEME_COLOR = "#a0c878"        #main green color
@@ -20,21 +24,24 @@ class RecordManager:
     def __init__(self, filename=RECORDS_FILE):
         self.filename = filename
         
+    @timed("RecordManager.load_records")
     def load_records(self):
         """Load records from JSON file"""
         if not os.path.exists(self.filename):
             return []
         try:
-            with open(self.filename, "r") as file:
+            with open(self.filename, "r") as file, timer("json.load"):
                 return json.load(file)
         except:
             return []
 
+    @timed("RecordManager.save_records")
     def save_records(self, records):
         """Save records to JSON file"""
-        with open(self.filename, "w") as file:
+        with open(self.filename, "w") as file, timer("json.dump"):
             json.dump(records, file, indent=4)
 
+    @timed("RecordManager.add_record")
     def add_record(self, record):
         """Add a new record"""
         records = self.load_records()
@@ -42,6 +49,7 @@ class RecordManager:
         self.save_records(records)
         return True
 
+    @timed("RecordManager.search_records")
     def search_records(self, search_term):
         """Search records by first or last name"""
         records = self.load_records()
@@ -275,6 +283,7 @@ class RecordApp:
         y = self.root.winfo_y() + (self.root.winfo_height() // 2) - (height // 2)
         window.geometry(f"{width}x{height}+{x}+{y}")
     
+    @timed("RecordApp.create_record_table")
     def create_record_table(self, parent, records):
         """Create a table to display records"""
         columns = ("First Name", "Middle Name", "Last Name", "Birthday", "Gender")
@@ -292,17 +301,19 @@ class RecordApp:
         if not records:
             tree.insert("", tk.END, values=("No records found", "", "", "", ""))
         else:
-            for record in records:
-                tree.insert("", tk.END, values=(
-                    record["first_name"],
-                    record["middle_name"],
-                    record["last_name"],
-                    record["birthday"],
-                    record["gender"]
-                ))
+            with timer("Treeview.insert"):
+                for record in records:
+                    tree.insert("", tk.END, values=(
+                        record["first_name"],
+                        record["middle_name"],
+                        record["last_name"],
+                        record["birthday"],
+                        record["gender"]
+                    ))
         
         return tree
     
+    @timed("RecordApp.view_records")
     def view_records(self):
         """Show all records"""
         view_window = tk.Toplevel(self.root)
@@ -336,6 +347,7 @@ class RecordApp:
                 padx=10, pady=5, 
                 command=view_window.destroy).pack(pady=10)
     
+    @timed("RecordApp.search_records")
     def search_records(self):
         """Search for records"""
         search_window = tk.Toplevel(self.root)
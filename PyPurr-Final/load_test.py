@@ -0,0 +1,133 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+
+from record_service import HOST, check_local, start_service
+
+
+class Client:
+    """One keep-alive HTTP/1.1 connection"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, target, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        head = (f"{method} {target} HTTP/1.1\r\nHost: {self.host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+        self.writer.write(head.encode("latin-1") + body)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def random_record(rng, i):
+    return {
+        "first_name": f"{rng.choice(['omar', 'john', 'maria', 'ana'])}{i}",
+        "middle_name": rng.choice(["zaratan", "santos", ""]),
+        "last_name": rng.choice(["francisco", "reyes", "cruz"]),
+        "birthday": f"{rng.randint(1990, 2010)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "gender": rng.choice(["Male", "Female", "Other"]),
+    }
+
+
+async def worker(client, requests, write_ratio, batch, rng, latencies, errors):
+    for i in range(requests):
+        start = time.perf_counter()
+        roll = rng.random()
+        if roll < write_ratio:
+            records = [random_record(rng, i) for _ in range(batch)]
+            status, _ = await client.request("POST", "/records", records if batch > 1 else records[0])
+        elif roll < write_ratio + (1 - write_ratio) / 2:
+            status, _ = await client.request("GET", f"/records?offset={rng.randint(0, 100)}&limit=20")
+        else:
+            status, _ = await client.request("GET", f"/records/search?q={rng.choice(['mar', 'cruz', 'jo'])}")
+        latencies.append(time.perf_counter() - start)
+        if status >= 400:
+            errors.append(status)
+
+
+async def run(host, port, connections, requests, write_ratio, batch, seed):
+    rng = random.Random(seed)
+    clients = [Client(host, port) for _ in range(connections)]
+    await asyncio.gather(*(client.connect() for client in clients))
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(client, requests, write_ratio, batch, random.Random(rng.random()), latencies, errors)
+        for client in clients))
+    elapsed = time.perf_counter() - start
+    await asyncio.gather(*(client.close() for client in clients))
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"{total} requests over {connections} keep-alive connections in {elapsed:.2f}s")
+    print(f"Requests/sec: {total / elapsed:,.0f}")
+    print(f"Latency ms: p50 {latencies[total // 2] * 1000:.2f}, "
+          f"p95 {latencies[int(total * 0.95)] * 1000:.2f}, p99 {latencies[int(total * 0.99)] * 1000:.2f}")
+    print(f"Errors: {len(errors)}")
+    return total / elapsed
+
+
+async def main_async(args):
+    if args.port:
+        return await run(args.host, args.port, args.connections, args.requests,
+                         args.write_ratio, args.batch, args.seed)
+
+    # no server given: start one on a throwaway records file
+    with tempfile.TemporaryDirectory() as workdir:
+        filename = os.path.join(workdir, "records.json")
+        server, service = await start_service(filename, HOST, 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with server:
+                await run(HOST, port, args.connections, args.requests,
+                          args.write_ratio, args.batch, args.seed)
+        finally:
+            await service.stop()
+        print(f"Records written: {len(service.records)} in {service.writes} file writes")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the record service on localhost")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=0, help="existing service (default: start one)")
+    parser.add_argument("-c", "--connections", type=int, default=20)
+    parser.add_argument("-n", "--requests", type=int, default=200, help="requests per connection")
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--batch", type=int, default=1, help="records per POST")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    try:
+        check_local(args.host)
+    except ValueError:
+        parser.error(f"{args.host} is not a localhost address: the record service is localhost only")
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+import argparse
+import asyncio
+import ipaddress
+import json
+import os
+from datetime import datetime
+from urllib.parse import parse_qs, urlsplit
+
+from PyPurr import RECORDS_FILE, RecordManager
+
+HOST = "127.0.0.1"
+PORT = 8765
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 1000
+MAX_BODY = 10 * 1024 * 1024
+KEEP_ALIVE_TIMEOUT = 15
+FIELDS = ("first_name", "middle_name", "last_name", "birthday", "gender")
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large", 414: "URI Too Long",
+           431: "Request Header Fields Too Large", 500: "Internal Server Error",
+           503: "Service Unavailable"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def validate_record(data):
+    """Same rules as RecordApp.validate_form, returns the cleaned record"""
+    if not isinstance(data, dict):
+        raise HTTPError(400, "Each record must be a JSON object")
+    record = {}
+    for field in FIELDS:
+        value = data.get(field, "")
+        if not isinstance(value, str):
+            raise HTTPError(400, f"{field} must be a string")
+        record[field] = value.strip()
+    if not record["gender"]:
+        record["gender"] = "Male"
+    if not record["first_name"] or not record["last_name"] or not record["birthday"]:
+        raise HTTPError(400, "First name, last name and birthday are required!")
+    try:
+        datetime.strptime(record["birthday"], "%Y-%m-%d")
+    except ValueError:
+        raise HTTPError(400, "Invalid date format! Use YYYY-MM-DD")
+    return record
+
+
+class RecordService:
+    """RecordManager behind a single writer: concurrent inserts share one file write
+
+    Records are served from memory. If something else changes the file
+    (e.g. the Tk app adding a record), the next request or write reloads
+    it first, so those records are kept. While the file doesn't parse
+    (half written, or corrupt) the last good copy is served and inserts
+    are refused with 503 instead of saving over it. The two programs do
+    not lock the file though: a save from each at the same instant can
+    still lose one, so don't sign people up in the app while a load test
+    runs.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.records = []
+        self.file_ok = False
+        self.stamp = None
+        self.queue = asyncio.Queue()
+        self.writer = None
+        self.writing = False
+        self.closed = False
+        self.writes = 0
+        self.refresh(force=True)
+
+    def start(self):
+        self.writer = asyncio.create_task(self._write_loop())
+
+    async def stop(self):
+        """Write the inserts already queued, then stop the writer"""
+        if self.writer is None:
+            return
+        self.closed = True
+        await self.queue.put(None)
+        try:
+            await self.writer
+        except asyncio.CancelledError:
+            pass
+        self.writer = None
+
+    def _stamp(self):
+        try:
+            info = os.stat(self.manager.filename)
+        except OSError:
+            return None
+        return info.st_mtime_ns, info.st_size
+
+    def _read_file(self):
+        """The file's records; unlike load_records() an unreadable file is an error, not []"""
+        if not os.path.exists(self.manager.filename):
+            return []
+        with open(self.manager.filename, "r") as file:
+            records = json.load(file)
+        if not isinstance(records, list):
+            raise ValueError("records file is not a JSON list")
+        return records
+
+    def refresh(self, force=False):
+        """Reload the records if the file was changed by someone else"""
+        if self.writing:
+            return
+        stamp = self._stamp()
+        if stamp == self.stamp and not force:
+            return
+        self.stamp = stamp
+        try:
+            self.records = self._read_file()
+            self.file_ok = True
+        except (OSError, ValueError):
+            # keep the last good copy; the next change to the file is read again
+            self.file_ok = False
+
+    async def add_records(self, records):
+        """Queue records for the writer and wait until they are on disk"""
+        if self.closed:
+            raise HTTPError(503, "Record service is shutting down")
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((records, future))
+        return await future
+
+    async def _write_loop(self):
+        batch = []
+        try:
+            while True:
+                item = await self.queue.get()
+                stopping = item is None
+                batch = [] if stopping else [item]
+                # everything that arrived meanwhile goes into the same write
+                while not self.queue.empty():
+                    item = self.queue.get_nowait()
+                    if item is None:
+                        stopping = True
+                    else:
+                        batch.append(item)
+                if batch:
+                    await self._write(batch)
+                batch = []
+                if stopping:
+                    return
+        finally:
+            # cancelled or stopped: nobody is going to write these
+            while not self.queue.empty():
+                item = self.queue.get_nowait()
+                if item is not None:
+                    batch.append(item)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(HTTPError(503, "Record service stopped"))
+
+    async def _write(self, batch):
+        self.refresh()
+        if not self.file_ok:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(HTTPError(
+                        503, f"{self.manager.filename} does not parse, not saving over it"))
+            return
+        new_records = [record for records, _ in batch for record in records]
+        updated = self.records + new_records
+        self.writing = True
+        try:
+            await asyncio.to_thread(self.manager.save_records, updated)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.writing = False
+        self.records = updated
+        self.stamp = self._stamp()
+        self.writes += 1
+        for records, future in batch:
+            if not future.done():
+                future.set_result(len(records))
+
+    def page(self, records, offset, limit):
+        return {"total": len(records), "offset": offset, "limit": limit,
+                "records": records[offset:offset + limit]}
+
+    def search(self, term):
+        """Same match as RecordManager.search_records, on the in-memory records"""
+        term = term.lower()
+        return [r for r in self.records if term in r["first_name"].lower()
+                or term in r["last_name"].lower()]
+
+
+def paging(query):
+    try:
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query.get("limit", [str(DEFAULT_LIMIT)])[0])
+    except ValueError:
+        raise HTTPError(400, "offset and limit must be integers")
+    if offset < 0 or limit < 1:
+        raise HTTPError(400, "offset must be >= 0 and limit >= 1")
+    return offset, min(limit, MAX_LIMIT)
+
+
+async def route(service, method, target, body):
+    url = urlsplit(target)
+    query = parse_qs(url.query)
+    path = url.path.rstrip("/") or "/"
+
+    service.refresh()
+    if path == "/health":
+        return 200, {"status": "ok" if service.file_ok else "records file unreadable",
+                     "records": len(service.records), "writes": service.writes}
+    if path == "/records":
+        if method == "GET":
+            offset, limit = paging(query)
+            return 200, service.page(service.records, offset, limit)
+        if method == "POST":
+            try:
+                data = json.loads(body or b"null")
+            except ValueError:
+                raise HTTPError(400, "Body must be JSON")
+            # one object or a list of them (batched insert)
+            items = data if isinstance(data, list) else [data]
+            if not items:
+                raise HTTPError(400, "No records given")
+            records = [validate_record(item) for item in items]
+            added = await service.add_records(records)
+            return 201, {"added": added}
+        raise HTTPError(405, "Use GET or POST")
+    if path == "/records/search":
+        if method != "GET":
+            raise HTTPError(405, "Use GET")
+        term = query.get("q", [""])[0].strip()
+        if not term:
+            raise HTTPError(400, "Please enter a search term")
+        offset, limit = paging(query)
+        return 200, service.page(service.search(term), offset, limit)
+    raise HTTPError(404, f"No route for {path}")
+
+
+async def read_line(reader, status, message):
+    try:
+        return await reader.readline()
+    except ValueError:
+        # a line longer than the StreamReader limit (LimitOverrunError)
+        raise HTTPError(status, message)
+
+
+async def read_request(reader):
+    """(method, target, headers, version, body) or None when the client closed the connection"""
+    line = await read_line(reader, 414, "Request line too long")
+    if not line:
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "Bad request line")
+    headers = {}
+    while True:
+        line = await read_line(reader, 431, "Header line too long")
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", "0") or 0)
+    except ValueError:
+        raise HTTPError(400, "Bad Content-Length")
+    if length < 0 or length > MAX_BODY:
+        raise HTTPError(413, "Body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, version, body
+
+
+def keep_alive(version, headers):
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+async def handle_connection(service, reader, writer):
+    try:
+        while True:
+            try:
+                request = await asyncio.wait_for(read_request(reader), KEEP_ALIVE_TIMEOUT)
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                break
+            except HTTPError as e:
+                await send(writer, e.status, {"error": str(e)}, False)
+                break
+            if request is None:
+                break
+            method, target, headers, version, body = request
+            reuse = keep_alive(version, headers)
+            try:
+                status, payload = await route(service, method, target, body)
+            except HTTPError as e:
+                status, payload = e.status, {"error": str(e)}
+            except Exception as e:
+                status, payload = 500, {"error": f"Internal error: {e}"}
+            await send(writer, status, payload, reuse)
+            if not reuse:
+                break
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def send(writer, status, payload, reuse):
+    body = json.dumps(payload).encode()
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if reuse else 'close'}\r\n\r\n")
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+
+def check_local(host):
+    if host == "localhost":
+        return
+    try:
+        if ipaddress.ip_address(host).is_loopback:
+            return
+    except ValueError:
+        pass
+    raise ValueError(f"Refusing to listen on {host}: the record service is localhost only")
+
+
+async def start_service(filename=RECORDS_FILE, host=HOST, port=PORT):
+    """Start the service; returns (server, service) with the server already listening"""
+    check_local(host)
+    service = RecordService(RecordManager(filename))
+    service.start()
+    server = await asyncio.start_server(
+        lambda r, w: handle_connection(service, r, w), host, port)
+    return server, service
+
+
+async def serve(filename, host, port):
+    server, service = await start_service(filename, host, port)
+    address = server.sockets[0].getsockname()
+    print(f"Serving {filename} on http://{address[0]}:{address[1]}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless HTTP/JSON API for PyPurr records")
+    parser.add_argument("--file", default=RECORDS_FILE,
+                        help="records JSON file (changes made by the Tk app are picked up, see RecordService)")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    args = parser.parse_args(argv)
+    try:
+        check_local(args.host)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        asyncio.run(serve(args.file, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
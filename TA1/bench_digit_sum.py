@@ -0,0 +1,55 @@
+import argparse
+import os
+import random
+import time
+
+from digit_sum import digit_value, sum_file
+
+
+def generate(filename, size_mb, seed=0):
+    """Write roughly size_mb megabytes of mixed text with a few non-ASCII digits"""
+    rng = random.Random(seed)
+    alphabet = "abcdefghij klmnop 0123456789 ,.\n"
+    block = "".join(rng.choice(alphabet) for _ in range(1024 * 1024)) + "٣۴５²"
+    with open(filename, "w", encoding="utf-8") as file:
+        for _ in range(size_mb):
+            file.write(block)
+
+
+def loop_sum(filename):
+    """The TA1_2.sum_d loop (int() swapped for digit_value, which accepts '²')"""
+    with open(filename, "r", encoding="utf-8") as file:
+        text = file.read()
+    total = 0
+    for char in text:
+        if char.isdigit():
+            total += digit_value(char)
+    return total
+
+
+def measure(name, func, *args):
+    start = time.perf_counter()
+    total = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {elapsed:8.3f}s  sum {total}")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Digit sum: per-char loop vs bulk counting")
+    parser.add_argument("--size-mb", type=int, default=32)
+    parser.add_argument("--file", default="bench_digits.txt")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.file):
+        print(f"Generating {args.size_mb} MB of input in {args.file}...")
+        generate(args.file, args.size_mb)
+
+    expected = measure("per-char", loop_sum, args.file)
+    assert measure("bulk", sum_file, args.file) == expected
+    assert measure(f"bulk x{args.workers}", sum_file, args.file, args.workers) == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import argparse
+import codecs
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+VOWELS = 'aeiou'
+CONSONANTS = 'bcdfghjklmnpqrstvwxyz'
+CHUNK_BYTES = 16 * 1024 * 1024
+BLOCK_BYTES = 1024 * 1024
+
+
+def _class_table():
+    """256-entry table mapping every ASCII byte to v/c/s/o (after lowercasing)"""
+    table = bytearray(b"o" * 256)
+    for letter in VOWELS:
+        table[ord(letter)] = table[ord(letter.upper())] = ord("v")
+    for letter in CONSONANTS:
+        table[ord(letter)] = table[ord(letter.upper())] = ord("c")
+    table[ord(" ")] = ord("s")
+    return bytes(table)
+
+
+CLASS_TABLE = _class_table()
+
+
+def classify_text(text):
+    """(vowels, consonants, spaces, others) exactly like TA1_1.count"""
+    text = text.lower()
+    v = sum(text.count(letter) for letter in VOWELS)
+    c = sum(text.count(letter) for letter in CONSONANTS)
+    s = text.count(' ')
+    return v, c, s, len(text) - v - c - s
+
+
+def classify_bytes(data):
+    """Same as classify_text(data.decode()), ASCII data classified by lookup table"""
+    if not data.isascii():
+        return classify_text(data.decode())
+    classes = data.translate(CLASS_TABLE)
+    v = classes.count(b"v")
+    c = classes.count(b"c")
+    s = classes.count(b"s")
+    return v, c, s, len(classes) - v - c - s
+
+
+def add_totals(a, b):
+    return tuple(x + y for x, y in zip(a, b))
+
+
+def classify_stream(file, block_bytes=BLOCK_BYTES, strip_newline=False):
+    """Classify a binary file object block by block
+
+    strip_newline leaves out one trailing line break, like input() does.
+    """
+    totals = (0, 0, 0, 0)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    last = b""
+    while True:
+        block = file.read(block_bytes)
+        if not block:
+            break
+        last = block[-1:]
+        if block.isascii() and not decoder.getstate()[0]:
+            totals = add_totals(totals, classify_bytes(block))
+        else:
+            # keep multi-byte characters split across blocks together
+            totals = add_totals(totals, classify_text(decoder.decode(block)))
+    totals = add_totals(totals, classify_text(decoder.decode(b"", final=True)))
+    if strip_newline and last == b"\n":
+        totals = add_totals(totals, (0, 0, 0, -1))
+    return totals
+
+
+def chunk_ranges(filename, chunk_bytes=CHUNK_BYTES):
+    """Split a file into (start, end) byte ranges that never cut a UTF-8 character"""
+    size = os.path.getsize(filename)
+    ranges = []
+    with open(filename, "rb") as file:
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            file.seek(end)
+            # skip UTF-8 continuation bytes (10xxxxxx)
+            while end < size and file.read(1)[0] & 0xC0 == 0x80:
+                end += 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def classify_range(filename, start, end):
+    with open(filename, "rb") as file:
+        file.seek(start)
+        return classify_bytes(file.read(end - start))
+
+
+def classify_file(filename, workers=1, chunk_bytes=CHUNK_BYTES):
+    """Totals for a whole file, optionally over chunks in worker processes"""
+    if workers <= 1:
+        with open(filename, "rb") as file:
+            return classify_stream(file)
+    totals = (0, 0, 0, 0)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        ranges = chunk_ranges(filename, chunk_bytes)
+        for counts in pool.map(classify_range, [filename] * len(ranges),
+                               [start for start, _ in ranges], [end for _, end in ranges]):
+            totals = add_totals(totals, counts)
+    return totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count vowels, consonants, spaces and other characters")
+    parser.add_argument("file", nargs="?",
+                        help="file to read, its line breaks count as other characters "
+                             "(default: stdin, read like one input() line)")
+    parser.add_argument("-w", "--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    if args.file:
+        v, c, s, o = classify_file(args.file, args.workers)
+    else:
+        v, c, s, o = classify_stream(sys.stdin.buffer, strip_newline=True)
+
+    print(f"Vowels: {v}")
+    print(f"Consonants: {c}")
+    print(f"Spaces: {s}")
+    print(f"Other characters: {o}")
+
+
+if __name__ == "__main__":
+    main()
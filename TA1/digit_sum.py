@@ -0,0 +1,92 @@
+import argparse
+import codecs
+import mmap
+import sys
+import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from char_classes import BLOCK_BYTES, CHUNK_BYTES, chunk_ranges
+
+ASCII_DIGITS = [(str(d).encode(), d) for d in range(1, 10)]
+# str.translate table that deletes every ASCII character
+DROP_ASCII = dict.fromkeys(range(128))
+
+
+def digit_value(char):
+    """Value of a digit character; unlike int(), also works for '²', '①'..."""
+    return unicodedata.digit(char)
+
+
+def sum_text(text):
+    """Sum of every digit character in text (same digits as str.isdigit)"""
+    data = text.encode("utf-8", "surrogatepass")
+    return sum_bytes_ascii(data) + sum_non_ascii(text)
+
+
+def sum_bytes_ascii(data):
+    """Sum of the ASCII digits in UTF-8 bytes: count each of '1'..'9' once and weight"""
+    return sum(data.count(digit) * value for digit, value in ASCII_DIGITS)
+
+
+def sum_non_ascii(text):
+    """Sum of the non-ASCII digit characters (Arabic-Indic, fullwidth, superscripts...)"""
+    rest = text.translate(DROP_ASCII)
+    if not rest:
+        return 0
+    return sum(digit_value(char) * n for char, n in Counter(rest).items() if char.isdigit())
+
+
+def sum_bytes(data):
+    """Digit sum of a UTF-8 encoded block"""
+    total = sum_bytes_ascii(data)
+    if not data.isascii():
+        total += sum_non_ascii(data.decode())
+    return total
+
+
+def sum_stream(file, block_bytes=BLOCK_BYTES):
+    """Digit sum of a binary file object, read block by block"""
+    total = 0
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while True:
+        block = file.read(block_bytes)
+        if not block:
+            break
+        total += sum_bytes_ascii(block)
+        if not block.isascii() or decoder.getstate()[0]:
+            total += sum_non_ascii(decoder.decode(block))
+    return total + sum_non_ascii(decoder.decode(b"", final=True))
+
+
+def sum_range(filename, start, end):
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return sum_bytes(mm[start:end])
+
+
+def sum_file(filename, workers=1, chunk_bytes=CHUNK_BYTES):
+    """Digit sum of a whole file, optionally over mmap chunks in worker processes"""
+    if workers <= 1:
+        with open(filename, "rb") as file:
+            return sum_stream(file)
+    ranges = chunk_ranges(filename, chunk_bytes)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(sum_range, [filename] * len(ranges),
+                            [start for start, _ in ranges], [end for _, end in ranges]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sum every digit in a file")
+    parser.add_argument("file", nargs="?", help="file to read (default: stdin)")
+    parser.add_argument("-w", "--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    if args.file:
+        total = sum_file(args.file, args.workers)
+    else:
+        total = sum_stream(sys.stdin.buffer)
+    print(f"Sum of digits: {total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import sys
+
+
+def counting_rows(height):
+    """Row bodies '1', '12', '123'... built from the previous row (TA_3a)"""
+    body = ""
+    for i in range(1, height + 1):
+        body += str(i)
+        yield i, body
+
+
+def repeated_rows(height):
+    """Row bodies '1', '22', '333'... (TA_3b)"""
+    for i in range(1, height + 1):
+        yield i, str(i) * i
+
+
+STYLES = {
+    "counting": counting_rows,
+    "repeated": repeated_rows,
+}
+
+
+def pyramid_rows(height, style="counting", skip=()):
+    """Yield each row of a right-aligned pyramid, newline included"""
+    rows = STYLES[style]
+    for i, body in rows(height):
+        if i in skip:
+            continue
+        yield " " * (height - i) + body + "\n"
+
+
+def render(height, style="counting", skip=()):
+    """The whole pyramid as one string"""
+    return "".join(pyramid_rows(height, style, skip))
+
+
+def write_pyramid(height, style="counting", skip=(), file=None):
+    """Print a pyramid with a single write call"""
+    (file or sys.stdout).write(render(height, style, skip))
+
+
+def TA_3a():
+    write_pyramid(5, "counting")
+
+
+def TA_3b():
+    write_pyramid(7, "repeated", skip={2, 4})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print a number pyramid")
+    parser.add_argument("height", type=int, nargs="?", default=5)
+    parser.add_argument("-s", "--style", choices=sorted(STYLES), default="counting")
+    parser.add_argument("--skip", type=int, nargs="*", default=[], help="row numbers to leave out")
+    args = parser.parse_args(argv)
+    write_pyramid(args.height, args.style, set(args.skip))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,19 @@
 # -- Accepts input for the last name, first name, age, contact number, and course from the user.
 # -- Creates a string containing the collected information in a formatted way.
 
+from student_store import StudentStore, make_record, read_legacy
+
 LName = input("Enter last name: ")
 FName = input("Enter first name: ")
 Age = int(input("Enter your age: "))
 ContactN = int(input("Enter contact number: "))
 Course = input ("Enter course: ")
-ALl_info = f"Name = {LName} + {FName},  Age= {Age}, Contact: {ContactN},John Course: {Course}"
 
-with open("C:\\Users\\202312737\\Documents\\GitHub\\it0011_francisco\\TFA2\\students.txt", "w") as f:
-    f.write(ALl_info)
-print("Student information has been saved to ‘students.txt’.")
-f.close()
+# appends to students.jsonl next to this file instead of overwriting students.txt
+with StudentStore() as store:
+    if not len(store):
+        # first save: carry over the student already in students.txt
+        store.add_many(read_legacy())
+    store.add(make_record(LName, FName, Age, ContactN, Course))
+print("Student information has been saved to ‘students.jsonl’.")
 
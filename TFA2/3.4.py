@@ -2,8 +2,37 @@
 # Objective: Apply file handling techniques to read and display student information from a file.
 
 # Task: Write a Python program that does the following:
-# -- Opens the "students.txt" file in read mode.
+# -- Opens the "students.jsonl" file (or the older "students.txt") in read mode.
 # -- Reads the contents of the file.
 # -- Displays the student information to the user
 
+import sys
+
+from student_store import StudentStore, format_record, read_legacy
+
+store = StudentStore()
 print("Reading Student Information")
+if len(store):
+    count = len(store)
+    get = store.get
+    records = store.records()
+else:
+    # nothing saved by the new 3.3 yet, show the old students.txt
+    legacy = read_legacy()
+    count = len(legacy)
+    get = legacy.__getitem__
+    records = legacy
+
+if len(sys.argv) > 1:
+    # python 3.4.py 5 -> only the 5th student, read with a single seek
+    try:
+        number = int(sys.argv[1])
+    except ValueError:
+        number = None
+    if number is not None and 1 <= number <= count:
+        print(format_record(get(number - 1)))
+    else:
+        print(f"No student number {sys.argv[1]}. There are {count} students.")
+else:
+    for record in records:
+        print(format_record(record))
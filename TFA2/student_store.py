@@ -0,0 +1,151 @@
+import json
+import os
+import re
+from array import array
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STUDENTS_FILE = os.path.join(HERE, "students.jsonl")
+# what 3.3 wrote before the store existed, one record per line
+LEGACY_FILE = os.path.join(HERE, "students.txt")
+LEGACY_LINE = re.compile(
+    r"Name = (.*?) \+ (.*?),\s+Age= (\d+), Contact: (\d+),(?:John)? ?Course: (.*)")
+FIELDS = ("last_name", "first_name", "age", "contact_number", "course")
+BATCH_SIZE = 1000
+
+
+def make_record(last_name, first_name, age, contact_number, course):
+    return {
+        "last_name": last_name,
+        "first_name": first_name,
+        "age": age,
+        "contact_number": contact_number,
+        "course": course,
+    }
+
+
+def format_record(record):
+    """The 3.3 text for one student"""
+    return (f"Name = {record['last_name']} + {record['first_name']},  Age= {record['age']}, "
+            f"Contact: {record['contact_number']}, Course: {record['course']}")
+
+
+def read_legacy(filename=LEGACY_FILE):
+    """Records from an old students.txt, lines that don't parse are skipped"""
+    if not os.path.exists(filename):
+        return []
+    records = []
+    with open(filename, "r", encoding="utf-8") as file:
+        for line in file:
+            match = LEGACY_LINE.fullmatch(line.strip())
+            if match:
+                last_name, first_name, age, contact_number, course = match.groups()
+                records.append(make_record(last_name, first_name, int(age), int(contact_number), course))
+    return records
+
+
+class StudentStore:
+    """Append-only JSON Lines file of students with a byte-offset index
+
+    The index lives next to the data file (students.jsonl.idx) as 8-byte
+    offsets, one per record, so get(n) is a single seek however big the
+    file gets. Records are buffered and written in batches.
+    """
+
+    def __init__(self, filename=STUDENTS_FILE, batch_size=BATCH_SIZE):
+        self.filename = filename
+        self.index_filename = filename + ".idx"
+        self.batch_size = batch_size
+        self.pending = []
+        self.offsets = self._load_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+    def _load_index(self):
+        """Read the saved offsets and index any records appended since"""
+        offsets = array("Q")
+        size = os.path.getsize(self.filename) if os.path.exists(self.filename) else 0
+        if os.path.exists(self.index_filename):
+            with open(self.index_filename, "rb") as file:
+                offsets.frombytes(file.read())
+            if offsets and offsets[-1] >= size:
+                # index is ahead of the data (file replaced or truncated)
+                offsets = array("Q")
+        indexed = len(offsets)
+        if size:
+            with open(self.filename, "rb") as file:
+                if offsets:
+                    file.seek(offsets[-1])
+                    file.readline()
+                position = file.tell()
+                for line in file:
+                    # blank lines are not records, records() skips them too
+                    if line.strip():
+                        offsets.append(position)
+                    position += len(line)
+        # no data file yet: nothing to index, and readers must not create files
+        if size and (len(offsets) != indexed or not os.path.exists(self.index_filename)):
+            self._write_index(offsets, start=indexed)
+        return offsets
+
+    def _write_index(self, offsets, start=0):
+        """Write offsets[start:] to the index file, replacing anything after them"""
+        mode = "r+b" if os.path.exists(self.index_filename) else "wb"
+        with open(self.index_filename, mode) as file:
+            file.truncate(start * offsets.itemsize)
+            file.seek(0, os.SEEK_END)
+            file.write(offsets[start:].tobytes())
+
+    def add(self, record):
+        """Queue a record; it is written with the next batch"""
+        missing = [field for field in FIELDS if field not in record]
+        if missing:
+            raise ValueError(f"Missing fields: {', '.join(missing)}")
+        self.pending.append(record)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def add_many(self, records):
+        for record in records:
+            self.add(record)
+
+    def flush(self):
+        """Write all queued records with one write call"""
+        if not self.pending:
+            return
+        lines = [json.dumps(record, ensure_ascii=False) + "\n" for record in self.pending]
+        data = "".join(lines).encode("utf-8")
+        with open(self.filename, "ab") as file:
+            position = file.tell()
+            file.write(data)
+        first_new = len(self.offsets)
+        for line in lines:
+            self.offsets.append(position)
+            position += len(line.encode("utf-8"))
+        self._write_index(self.offsets, start=first_new)
+        self.pending = []
+
+    def __len__(self):
+        return len(self.offsets) + len(self.pending)
+
+    def get(self, number):
+        """Record by number (0-based, negative counts from the end)"""
+        self.flush()
+        offset = self.offsets[number]
+        with open(self.filename, "rb") as file:
+            file.seek(offset)
+            return json.loads(file.readline())
+
+    def records(self, start=0):
+        """Stream records from record number start onwards"""
+        self.flush()
+        if start >= len(self.offsets):
+            return
+        with open(self.filename, "rb") as file:
+            file.seek(self.offsets[start])
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
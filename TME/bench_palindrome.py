@@ -0,0 +1,72 @@
+import argparse
+import os
+import random
+import time
+
+from palindrome_stream import fast_results, parallel_results, stream_results
+
+
+def generate(filename, size_mb, seed=0):
+    """Write roughly size_mb megabytes of comma-separated number lines"""
+    rng = random.Random(seed)
+    target = size_mb * 1024 * 1024
+    block = []
+    for _ in range(10000):
+        count = rng.randint(2, 8)
+        block.append(",".join(str(rng.randint(0, 1200)) for _ in range(count)))
+    block = "\n".join(block) + "\n"
+    written = 0
+    with open(filename, "w") as file:
+        while written < target:
+            file.write(block)
+            written += len(block)
+
+
+def readlines_results(filename):
+    """The original MidtermProgram1 approach"""
+    with open(filename, "r") as file:
+        lines = file.readlines()
+    for i, line in enumerate(lines, start=1):
+        numbers = [int(num) for num in line.strip().split(",") if num.strip().isdigit()]
+        if not numbers:
+            continue
+        total_sum = sum(numbers)
+        result = "Palindrome" if str(total_sum) == str(total_sum)[::-1] else "Not a palindrome"
+        yield f"Line {i}: {line.strip()} (sum {total_sum}) - {result}"
+
+
+def measure(name, results, size):
+    start = time.perf_counter()
+    count = 0
+    with open(os.devnull, "w") as out:
+        for output in results:
+            out.write(output + "\n")
+            count += 1
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {elapsed:8.2f}s  {size / elapsed / 1024 / 1024:8.1f} MB/s  {count} lines")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput of the palindrome-sum checker")
+    parser.add_argument("--size-mb", type=int, default=64, help="input size (use 2048+ for multi-GB)")
+    parser.add_argument("--file", default="bench_numbers.txt")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--skip-readlines", action="store_true",
+                        help="skip the original approach (it loads the whole file)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.file) or os.path.getsize(args.file) < args.size_mb * 1024 * 1024:
+        print(f"Generating {args.size_mb} MB of input in {args.file}...")
+        generate(args.file, args.size_mb)
+    size = os.path.getsize(args.file)
+
+    if not args.skip_readlines:
+        measure("readlines", readlines_results(args.file), size)
+    measure("streaming", stream_results(args.file), size)
+    measure("fast", fast_results(args.file), size)
+    measure(f"parallel x{args.workers}", parallel_results(args.file, args.workers), size)
+    measure(f"fast x{args.workers}", parallel_results(args.file, args.workers, fast=True), size)
+
+
+if __name__ == "__main__":
+    main()
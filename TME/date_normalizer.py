@@ -0,0 +1,115 @@
+import argparse
+import sys
+from functools import lru_cache
+
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+# "01, ".."31, " and "January ".."December " so formatting is two lookups and a concat
+DAY_TEXT = tuple(f"{day:02d}, " for day in range(32))
+MONTH_TEXT = tuple(f"{name} " for name in MONTH_NAMES)
+CACHE_SIZE = 65536
+
+
+def is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def parse_number(text):
+    """Parse a run of ASCII digits, None for anything else"""
+    text = text.strip()
+    if not text or not text.isascii() or not text.isdigit():
+        return None
+    return int(text)
+
+
+def parse_date(text):
+    """Parse 'mm/dd/yyyy' into (year, month, day), raising ValueError when invalid"""
+    if len(text) == 10 and text[2] == "/" and text[5] == "/" and text.isascii() \
+            and (text[:2] + text[3:5] + text[6:]).isdigit():
+        # zero-padded fast path, the usual shape of exported dates
+        month, day, year = int(text[:2]), int(text[3:5]), int(text[6:])
+    else:
+        parts = text.strip().split("/")
+        if len(parts) != 3:
+            raise ValueError("expected mm/dd/yyyy")
+        month, day, year = (parse_number(part) for part in parts)
+        if month is None or day is None or year is None:
+            raise ValueError("month, day and year must be numbers")
+    if not 1 <= year <= 9999:
+        raise ValueError("year is out of range")
+    if not 1 <= month <= 12:
+        raise ValueError("month must be in 1..12")
+    last_day = 29 if month == 2 and is_leap(year) else DAYS_IN_MONTH[month - 1]
+    if not 1 <= day <= last_day:
+        raise ValueError("day is out of range for month")
+    return year, month, day
+
+
+def format_date(year, month, day):
+    """Same text as '{:%B %d, %Y}'.format(datetime)"""
+    return MONTH_TEXT[month - 1] + DAY_TEXT[day] + str(year)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize(text):
+    """'03/07/2025' -> 'March 07, 2025' (cached, exports repeat a lot)"""
+    return format_date(*parse_date(text))
+
+
+def normalize_lines(lines):
+    """Yield (line number, normalized date or None, error or None) for each non-blank line"""
+    for i, line in enumerate(lines, start=1):
+        text = line.strip()
+        if not text:
+            continue
+        try:
+            yield i, normalize(text), None
+        except ValueError as e:
+            yield i, None, f"Line {i}: invalid date {text!r} ({e})"
+
+
+def normalize_batch(dates):
+    """Normalize a list of date strings, None for invalid ones"""
+    results = []
+    append = results.append
+    for text in dates:
+        try:
+            append(normalize(text))
+        except ValueError:
+            append(None)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert mm/dd/yyyy dates to 'Month dd, yyyy'")
+    parser.add_argument("file", nargs="?", help="file with one date per line (default: stdin)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not report invalid dates")
+    parser.add_argument("--stats", action="store_true", help="print cache statistics at the end")
+    args = parser.parse_args(argv)
+
+    source = open(args.file, "r") if args.file else sys.stdin
+    errors = 0
+    write = sys.stdout.write
+    try:
+        for i, date, error in normalize_lines(source):
+            if error is None:
+                write(date + "\n")
+            else:
+                errors += 1
+                if not args.quiet:
+                    print(error, file=sys.stderr)
+    finally:
+        if args.file:
+            source.close()
+
+    if args.stats:
+        info = normalize.cache_info()
+        print(f"{errors} invalid date(s), cache hits {info.hits}, misses {info.misses}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
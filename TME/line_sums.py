@@ -0,0 +1,49 @@
+ALLOWED = b"0123456789,\n"
+
+
+def is_simple(data):
+    """True if data only has digits, commas and newlines (checked in one C call)"""
+    return not data.translate(None, ALLOWED)
+
+
+def parse_line(line):
+    """The MidtermProgram1 rule: sum the digit tokens, None if there are none"""
+    numbers = [int(num) for num in line.strip().split(",") if num.strip().isdigit()]
+    if not numbers:
+        return None
+    return sum(numbers)
+
+
+def fast_sums(data):
+    """Line sums of a block of plain comma-separated digits
+
+    Empty tokens (",,") and empty lines give no numbers, same as parse_line.
+    """
+    sums = []
+    append = sums.append
+    for line in data.split(b"\n"):
+        tokens = line.split(b",")
+        if b"" in tokens:
+            tokens = [t for t in tokens if t]
+            if not tokens:
+                append(None)
+                continue
+        append(sum(map(int, tokens)))
+    return sums
+
+
+def line_sums(data):
+    """Sum of each line of a bytes block, None for lines without numbers
+
+    A trailing newline does not start an extra line. Blocks with anything
+    other than digits, commas and newlines (spaces, signs, Windows line
+    endings, non-ASCII digits...) go through the original per-token rule.
+    """
+    if not data:
+        return []
+    if data.endswith(b"\n"):
+        data = data[:-1]
+    if is_simple(data):
+        return fast_sums(data)
+    text = data.decode()
+    return [parse_line(line) for line in text.split("\n")]
@@ -0,0 +1,172 @@
+import argparse
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from line_sums import line_sums
+
+CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def is_palindrome(n):
+    """Check if a non-negative integer reads the same backwards, without str()"""
+    if n < 0:
+        return False
+    if n < 10:
+        return True
+    if n % 10 == 0:
+        return False
+    reverse = 0
+    while n > reverse:
+        reverse = reverse * 10 + n % 10
+        n //= 10
+    return n == reverse or n == reverse // 10
+
+
+def check_line(line):
+    """(stripped line, sum, result) for a line, or None if it has no numbers"""
+    line = line.strip()
+    total_sum = 0
+    found = False
+    for num in line.split(","):
+        if num.strip().isdigit():
+            total_sum += int(num)
+            found = True
+    if not found:
+        return None
+    result = "Palindrome" if is_palindrome(total_sum) else "Not a palindrome"
+    return line, total_sum, result
+
+
+def format_line(i, checked):
+    line, total_sum, result = checked
+    return f"Line {i}: {line} (sum {total_sum}) - {result}"
+
+
+def check_block(data):
+    """Check every line of a bytes block at once, one entry per line"""
+    lines = data.decode().split("\n")
+    if data.endswith(b"\n"):
+        lines.pop()
+    checked_lines = []
+    for line, total_sum in zip(lines, line_sums(data)):
+        if total_sum is None:
+            checked_lines.append(None)
+        else:
+            result = "Palindrome" if is_palindrome(total_sum) else "Not a palindrome"
+            checked_lines.append((line.strip(), total_sum, result))
+    return checked_lines
+
+
+def fast_results(filename, block_bytes=1024 * 1024):
+    """Like stream_results, but sums whole blocks of lines in bulk"""
+    i = 0
+    with open(filename, "rb") as file:
+        while True:
+            data = file.read(block_bytes)
+            if not data:
+                break
+            if not data.endswith(b"\n"):
+                data += file.readline()
+            for checked in check_block(data):
+                i += 1
+                if checked is not None:
+                    yield format_line(i, checked)
+
+
+def stream_results(filename):
+    """Yield output lines while reading the file in small blocks (constant memory)"""
+    i = 0
+    with open(filename, "r") as file:
+        # readlines(hint) reads ~1 MB of whole lines at a time
+        while True:
+            lines = file.readlines(1024 * 1024)
+            if not lines:
+                break
+            for line in lines:
+                i += 1
+                checked = check_line(line)
+                if checked is not None:
+                    yield format_line(i, checked)
+
+
+def chunk_ranges(filename, chunk_bytes=CHUNK_BYTES):
+    """Split a file into (start, end) byte ranges that end on a newline"""
+    size = os.path.getsize(filename)
+    if size == 0:
+        return []
+    ranges = []
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                newline = mm.find(b"\n", end - 1)
+                end = size if newline == -1 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def check_range(filename, start, end, fast=False):
+    """Check the lines in one byte range, numbering them from 1 within the range"""
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[start:end]
+    if fast:
+        checked_all = check_block(data)
+    else:
+        lines = data.decode().split("\n")
+        if data.endswith(b"\n"):
+            lines.pop()
+        checked_all = [check_line(line) for line in lines]
+    checked_lines = [(i, checked) for i, checked in enumerate(checked_all, start=1) if checked is not None]
+    return len(checked_all), checked_lines
+
+
+def parallel_results(filename, workers=None, chunk_bytes=CHUNK_BYTES, fast=False):
+    """Yield output lines in order, checking memory-mapped chunks in worker processes"""
+    workers = workers or os.cpu_count() or 1
+    offset = 0
+
+    def renumber(counted):
+        nonlocal offset
+        line_count, checked_lines = counted
+        for i, checked in checked_lines:
+            yield format_line(offset + i, checked)
+        offset += line_count
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for start, end in chunk_ranges(filename, chunk_bytes):
+            pending.append(pool.submit(check_range, filename, start, end, fast))
+            if len(pending) >= workers * 2:
+                yield from renumber(pending.pop(0).result())
+        for future in pending:
+            yield from renumber(future.result())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check if the sum of each line of numbers is a palindrome")
+    parser.add_argument("file", nargs="?", default="numbers.txt")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="worker processes (more than 1 uses memory-mapped chunks)")
+    parser.add_argument("--fast", action="store_true",
+                        help="sum plain comma-separated digit lines in bulk")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_BYTES // (1024 * 1024))
+    args = parser.parse_args(argv)
+
+    if args.workers > 1:
+        results = parallel_results(args.file, args.workers, args.chunk_mb * 1024 * 1024, args.fast)
+    elif args.fast:
+        results = fast_results(args.file)
+    else:
+        results = stream_results(args.file)
+
+    write = sys.stdout.write
+    for output in results:
+        write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
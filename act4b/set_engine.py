@@ -0,0 +1,208 @@
+import argparse
+import re
+
+TOKEN = re.compile(r"\s*(?:([A-Za-z_]\w*)|([&|^\-~()]))")
+
+
+class Universe:
+    """Every element sets can contain, each mapped to a bit position"""
+
+    def __init__(self, elements=()):
+        self.elements = []
+        self.index = {}
+        for element in elements:
+            self.add(element)
+
+    def add(self, element):
+        if element not in self.index:
+            self.index[element] = len(self.elements)
+            self.elements.append(element)
+        return self.index[element]
+
+    def __len__(self):
+        return len(self.elements)
+
+    def to_bits(self, elements):
+        """Bitset (an int) for some elements, adding unseen ones to the universe"""
+        positions = [self.add(element) for element in elements]
+        if len(positions) < 64:
+            bits = 0
+            for position in positions:
+                bits |= 1 << position
+            return bits
+        # big sets: fill a byte buffer and convert once
+        buffer = bytearray((len(self.elements) + 7) // 8)
+        for position in positions:
+            buffer[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(buffer, "little")
+
+    def from_bits(self, bits):
+        """The elements of a bitset, in universe order"""
+        elements = self.elements
+        result = []
+        data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+        for byte_index, byte in enumerate(data):
+            while byte:
+                low = byte & -byte
+                result.append(elements[(byte_index << 3) + low.bit_length() - 1])
+                byte ^= low
+        return result
+
+    def full(self):
+        return (1 << len(self.elements)) - 1
+
+
+def tokenize(expression):
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = TOKEN.match(expression, position)
+        if not match:
+            raise ValueError(f"Unexpected character at {position}: {expression[position:]!r}")
+        tokens.append(match.group(1) or match.group(2))
+        position = match.end()
+    return tokens
+
+
+class Parser:
+    """Set expressions with Python's precedence: ~ then - then & then ^ then |"""
+
+    LEVELS = ("|", "^", "&", "-")
+
+    def __init__(self, expression):
+        self.tokens = tokenize(expression)
+        self.position = 0
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("Empty expression")
+        tree = self.binary(0)
+        if self.position != len(self.tokens):
+            raise ValueError(f"Unexpected {self.tokens[self.position]!r}")
+        return tree
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self):
+        token = self.peek()
+        if token is None:
+            raise ValueError("Expression ended too early")
+        self.position += 1
+        return token
+
+    def binary(self, level):
+        if level == len(self.LEVELS):
+            return self.unary()
+        tree = self.binary(level + 1)
+        while self.peek() == self.LEVELS[level]:
+            op = self.take()
+            tree = (op, tree, self.binary(level + 1))
+        return tree
+
+    def unary(self):
+        token = self.take()
+        if token == "~":
+            return ("~", self.unary())
+        if token == "(":
+            tree = self.binary(0)
+            if self.take() != ")":
+                raise ValueError("Missing ')'")
+            return tree
+        if token in "&|^-)":
+            raise ValueError(f"Unexpected {token!r}")
+        return token
+
+
+def parse(expression):
+    """Parse an expression like '(A & B) - C' into nested tuples"""
+    return Parser(expression).parse()
+
+
+class SetEngine:
+    def __init__(self, universe=None):
+        self.universe = universe or Universe()
+        self.sets = {}
+        self.cache = {}  # expression tree -> bitset, shared by subexpressions
+
+    def define(self, name, elements):
+        """Define (or redefine) a named set"""
+        self.sets[name] = self.universe.to_bits(elements)
+        self.cache.clear()
+
+    def define_bits(self, name, bits):
+        self.sets[name] = bits
+        self.cache.clear()
+
+    def evaluate(self, expression):
+        """Bitset for an expression string or parsed tree"""
+        tree = parse(expression) if isinstance(expression, str) else expression
+        return self._evaluate(tree)
+
+    def _evaluate(self, tree):
+        if tree in self.cache:
+            return self.cache[tree]
+        if isinstance(tree, str):
+            if tree not in self.sets:
+                raise ValueError(f"Unknown set: {tree}")
+            return self.sets[tree]
+        if tree[0] == "~":
+            bits = self.universe.full() & ~self._evaluate(tree[1])
+        else:
+            op, left, right = tree
+            left = self._evaluate(left)
+            right = self._evaluate(right)
+            if op == "&":
+                bits = left & right
+            elif op == "|":
+                bits = left | right
+            elif op == "^":
+                bits = left ^ right
+            else:
+                bits = left & ~right
+        self.cache[tree] = bits
+        return bits
+
+    def elements(self, expression):
+        return self.universe.from_bits(self.evaluate(expression))
+
+    def count(self, expression):
+        return self.evaluate(expression).bit_count()
+
+
+def activity_engine():
+    """The sets A, B and C from act4b/1.py"""
+    engine = SetEngine(Universe("ABCDEFGHIJK"))
+    engine.define("A", ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K'])
+    engine.define("B", ['B', 'C', 'D', 'F', 'H', 'I', 'J', 'K'])
+    engine.define("C", ['C', 'D', 'E', 'F', 'G', 'H'])
+    return engine
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate set expressions over A, B and C from act4b/1.py")
+    parser.add_argument("expressions", nargs="*", help="e.g. '(A & B) - C'")
+    parser.add_argument("-d", "--define", action="append", default=[], metavar="NAME=a,b,c",
+                        help="define or replace a set")
+    args = parser.parse_args(argv)
+
+    engine = activity_engine()
+    for definition in args.define:
+        name, _, elements = definition.partition("=")
+        engine.define(name.strip(), [e.strip() for e in elements.split(",") if e.strip()])
+
+    if not args.expressions:
+        print(f"How many elements are there in set A and B: {engine.count('A & B')}")
+        print(f"Number of elements in B not in A or C: {engine.count('B - (A | C)')}")
+        return
+
+    for expression in args.expressions:
+        try:
+            print(f"{expression} = {set(engine.elements(expression))}")
+        except ValueError as e:
+            print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from cache import CachedEngine, ResultCache
+from engine import CalculatorEngine, convert, format_number
+
+# choice -> (operation name, engine method)
+OPERATIONS = {
+    "D": ("Division", "divide"),
+    "E": ("Exponentiation", "exponentiation"),
+    "R": ("Remainder", "remainder"),
+    "F": ("Summation", "summation"),
+}
+CHUNK_SIZE = 1000
+
+
+def parse_operand(token, mode):
+    """int for integer tokens, otherwise the token itself once the mode accepts it"""
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    try:
+        convert(token, mode)
+    except (ValueError, ArithmeticError):
+        raise ValueError(f"Not a number: {token}")
+    # the engine converts it, so no precision is lost to float on the way
+    return token
+
+
+def evaluate_line(line, engine):
+    """Evaluate one 'D 10 3' style line and return the output text"""
+    parts = line.split()
+    if not parts:
+        return None
+    choice = parts[0].upper()
+    if choice not in OPERATIONS:
+        return "Invalid choice. Please try again."
+    try:
+        if len(parts) != 3:
+            raise ValueError
+        num1 = parse_operand(parts[1], engine.mode)
+        num2 = parse_operand(parts[2], engine.mode)
+    except ValueError:
+        return "Invalid input. Please Try again."
+
+    op, method = OPERATIONS[choice]
+    try:
+        result = getattr(engine, method)(num1, num2)
+    except (ArithmeticError, ValueError):
+        # one bad line must not stop the rest of the batch
+        result = None
+    if result is None:
+        return f"Error: Invalid input for {op}"
+    if engine.mode == "float" and choice != "F" and isinstance(result, int):
+        # the interactive calculator prints 8.0 for 2 ** 3, keep that unless float would be wrong
+        try:
+            if float(result) == result:
+                result = float(result)
+        except OverflowError:
+            pass
+    return f"Result: {format_number(result)}"
+
+
+def evaluate_chunk(lines, mode="float", engine=None):
+    """Evaluate a list of lines, skipping blank ones"""
+    engine = engine or CalculatorEngine(mode)
+    results = []
+    for line in lines:
+        output = evaluate_line(line, engine)
+        if output is not None:
+            results.append(output)
+    return results
+
+
+def chunked(lines, size):
+    it = iter(lines)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(lines, workers=None, chunk_size=CHUNK_SIZE, mode="float", engine=None):
+    """Yield results in input order, evaluating chunks in a process pool
+
+    Passing an engine (e.g. a CachedEngine) evaluates everything in this
+    process so the engine's state is shared across all lines.
+    """
+    if workers == 1 or engine is not None:
+        engine = engine or CalculatorEngine(mode)
+        for chunk in chunked(lines, chunk_size):
+            yield from evaluate_chunk(chunk, mode, engine)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        max_pending = workers * 2
+        for chunk in chunked(lines, chunk_size):
+            pending.append(pool.submit(evaluate_chunk, chunk, mode))
+            # keep a bounded window so huge inputs are streamed, not loaded
+            if len(pending) >= max_pending:
+                yield from pending.pop(0).result()
+        for future in pending:
+            yield from future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate calculator operations in batch")
+    parser.add_argument("file", nargs="?", help="file of operations (default: stdin)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("-c", "--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("-m", "--mode", choices=["float", "decimal", "fraction"], default="float")
+    parser.add_argument("--cache-size", type=int, default=0, help="memoize results (runs in one process)")
+    parser.add_argument("--cache-ttl", type=float, default=None, help="seconds before a cached result expires")
+    parser.add_argument("--cache-file", help="load and save the result cache here")
+    args = parser.parse_args(argv)
+
+    engine = None
+    if args.cache_size or args.cache_file:
+        cache = ResultCache(args.cache_size or 1024, args.cache_ttl, clock=time.time)
+        if args.cache_file:
+            cache.load(args.cache_file)
+        engine = CachedEngine(CalculatorEngine(args.mode), cache)
+
+    source = open(args.file, "r") if args.file else sys.stdin
+    try:
+        out = sys.stdout
+        for result in run_batch(source, args.workers, args.chunk_size, args.mode, engine):
+            out.write(result + "\n")
+    finally:
+        if args.file:
+            source.close()
+
+    if engine is not None:
+        if args.cache_file:
+            engine.cache.save(args.cache_file)
+        stats = engine.cache.stats()
+        print(f"Cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"hit rate {stats['hit_rate']:.1%}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
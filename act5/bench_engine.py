@@ -0,0 +1,45 @@
+import timeit
+
+from engine import CalculatorEngine
+
+
+def loop_summation(a, b):
+    """The original range loop from the calculator script"""
+    total = 0
+    for num in range(int(a), int(b) + 1):
+        total += num
+    return total
+
+
+def bench(func, *args, repeat=3):
+    """Best time in seconds of calling func(*args)"""
+    return min(timeit.repeat(lambda: func(*args), number=1, repeat=repeat))
+
+
+def main():
+    engine = CalculatorEngine()
+    print(f"{'range size':>16} | {'loop (s)':>12} | {'closed form (s)':>16}")
+    for size in (10**3, 10**5, 10**6, 10**7, 10**12, 10**100):
+        closed = bench(engine.summation, 1, size)
+        if size <= 10**7:
+            assert loop_summation(1, size) == engine.summation(1, size)
+            loop = f"{bench(loop_summation, 1, size, repeat=1):12.6f}"
+        else:
+            loop = f"{'(skipped)':>12}"
+        print(f"{size:>16.0e} | {loop} | {closed:16.8f}")
+
+    print()
+    print("Exponentiation (float ** vs engine):")
+    for a, b in ((2.0, 100.0), (2.0, 2000.0), (10.0, 400.0)):
+        try:
+            float_result = f"{a ** b:.6e}"
+        except OverflowError:
+            float_result = "OverflowError"
+        engine_time = bench(engine.exponentiation, a, b)
+        print(f"{a} ** {b}: float -> {float_result}, engine -> {engine_time:.8f}s exact")
+    mod_time = bench(engine.exponentiation, 7, 10**18, 1_000_000_007)
+    print(f"pow(7, 10**18, 1_000_000_007): {mod_time:.8f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from fractions import Fraction
+
+from engine import CalculatorEngine
+
+MISSING = object()
+
+
+def encode_value(value):
+    """A cached operand or result as plain JSON data"""
+    # hex keeps huge integers clear of the int -> str digit limit
+    if value is None:
+        return ["none"]
+    if isinstance(value, bool):
+        raise TypeError(f"Cannot cache {value!r}")
+    if isinstance(value, int):
+        return ["int", hex(value)]
+    if isinstance(value, float):
+        return ["float", repr(value)]
+    if isinstance(value, Decimal):
+        return ["decimal", str(value)]
+    if isinstance(value, Fraction):
+        return ["fraction", hex(value.numerator), hex(value.denominator)]
+    if isinstance(value, str):
+        return ["str", value]
+    raise TypeError(f"Cannot cache {value!r}")
+
+
+def decode_value(data):
+    """Inverse of encode_value, ValueError for anything it did not write"""
+    if not isinstance(data, list) or not data:
+        raise ValueError(f"Bad cache value: {data!r}")
+    kind, *args = data
+    if kind == "none" and not args:
+        return None
+    if len(args) == 1 and isinstance(args[0], str):
+        text = args[0]
+        if kind == "int":
+            return int(text, 16)
+        if kind == "float":
+            return float(text)
+        if kind == "decimal":
+            return Decimal(text)
+        if kind == "str":
+            return text
+    if kind == "fraction" and len(args) == 2 and all(isinstance(a, str) for a in args):
+        return Fraction(int(args[0], 16), int(args[1], 16))
+    raise ValueError(f"Bad cache value: {data!r}")
+
+
+def encode_key(key):
+    mode, operation, operands = key
+    return [mode, operation, [encode_value(operand) for operand in operands]]
+
+
+def decode_key(data):
+    mode, operation, operands = data
+    if not (isinstance(mode, str) and isinstance(operation, str) and isinstance(operands, list)):
+        raise ValueError(f"Bad cache key: {data!r}")
+    return (mode, operation, tuple(decode_value(operand) for operand in operands))
+
+
+class ResultCache:
+    def __init__(self, max_size=1024, ttl=None, clock=time.monotonic):
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1.")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()  # key -> (stored_at, value)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=MISSING):
+        """Return the cached value, or default on a miss"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            if self.ttl is None or self.clock() - stored_at < self.ttl:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self.entries[key]
+            self.expirations += 1
+        self.misses += 1
+        return default
+
+    def put(self, key, value, stored_at=None):
+        """Store a value, evicting the least recently used entry if full"""
+        if stored_at is None:
+            stored_at = self.clock()
+        self.entries[key] = (stored_at, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def stats(self):
+        """Hit/miss counters and hit rate"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def save(self, filename):
+        """Write the entries to disk with their age, so TTL survives restarts"""
+        now = self.clock()
+        data = []
+        for key, (stored_at, value) in self.entries.items():
+            try:
+                data.append([encode_key(key), now - stored_at, encode_value(value)])
+            except TypeError:
+                # e.g. a complex result, the file only stores real numbers
+                continue
+        tmp = filename + ".tmp"
+        with open(tmp, "w") as file:
+            json.dump(data, file)
+        os.replace(tmp, filename)
+
+    def load(self, filename):
+        """Read entries saved by save(), dropping expired ones"""
+        if not os.path.exists(filename):
+            return 0
+        try:
+            with open(filename, "r") as file:
+                data = json.load(file)
+            entries = [(decode_key(key), float(age), decode_value(value)) for key, age, value in data]
+        except (OSError, ValueError, TypeError, ArithmeticError):
+            # missing, corrupt or not written by save(): start empty
+            return 0
+        now = self.clock()
+        loaded = 0
+        for key, age, value in entries:
+            if self.ttl is not None and age >= self.ttl:
+                continue
+            self.put(key, value, stored_at=now - age)
+            loaded += 1
+        return loaded
+
+
+class CachedEngine:
+    """CalculatorEngine whose results are memoized by (operation, operands)"""
+
+    def __init__(self, engine=None, cache=None):
+        self.engine = engine or CalculatorEngine()
+        self.cache = cache if cache is not None else ResultCache()
+
+    def _call(self, operation, *operands):
+        key = (self.engine.mode, operation, operands)
+        result = self.cache.get(key)
+        if result is MISSING:
+            result = getattr(self.engine, operation)(*operands)
+            self.cache.put(key, result)
+        return result
+
+    def divide(self, a, b):
+        return self._call("divide", a, b)
+
+    def exponentiation(self, a, b, modulus=None):
+        return self._call("exponentiation", a, b, modulus)
+
+    def remainder(self, a, b):
+        return self._call("remainder", a, b)
+
+    def summation(self, a, b):
+        return self._call("summation", a, b)
+
+    @property
+    def mode(self):
+        return self.engine.mode
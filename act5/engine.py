@@ -0,0 +1,194 @@
+import math
+from decimal import MAX_EMAX, MIN_EMIN, Decimal, DecimalException, localcontext
+from fractions import Fraction
+
+MODES = ("float", "decimal", "fraction")
+DECIMAL_PRECISION = 50
+# Exact integer powers bigger than this many bits fall back to Decimal
+MAX_EXACT_BITS = 10_000_000
+# Integers longer than this are printed in scientific notation
+MAX_PRINT_DIGITS = 4000
+
+
+def arithmetic_sum(start, stop):
+    """Sum of every integer from start to stop (inclusive) in O(1)"""
+    if stop < start:
+        return 0
+    return (start + stop) * (stop - start + 1) // 2
+
+
+def is_integral(value):
+    """Check if a number has no fractional part"""
+    if isinstance(value, int):
+        return True
+    if isinstance(value, float):
+        return value.is_integer()
+    if isinstance(value, Fraction):
+        return value.denominator == 1
+    if isinstance(value, Decimal):
+        return value.is_finite() and value == value.to_integral_value()
+    return False
+
+
+def is_finite(value):
+    """False for inf and nan in any of the modes"""
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, Decimal):
+        return value.is_finite()
+    return True
+
+
+def convert(value, mode="float"):
+    """Convert a number or numeric string to the given mode"""
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode}")
+    if mode == "decimal":
+        if isinstance(value, float):
+            return Decimal(repr(value))
+        return Decimal(value)
+    if mode == "fraction":
+        if isinstance(value, str):
+            return Fraction(value.strip())
+        return Fraction(value)
+    if isinstance(value, (int, float)):
+        return value
+    return float(value)
+
+
+def format_number(value):
+    """Text for a result, huge integers shortened to scientific notation"""
+    if isinstance(value, int) and value.bit_length() > MAX_PRINT_DIGITS * 3:
+        shift = value.bit_length() - 64
+        log10 = math.log10(abs(value) >> shift) + shift * math.log10(2)
+        exponent = math.floor(log10)
+        mantissa = f"{10 ** (log10 - exponent):.10f}"
+        if float(mantissa) >= 10:
+            # 9.99999999999 rounds up to 10, move it to the exponent
+            exponent += 1
+            mantissa = f"{float(mantissa) / 10:.10f}"
+        sign = "-" if value < 0 else ""
+        return f"{sign}{mantissa}e+{exponent}"
+    return str(value)
+
+
+class CalculatorEngine:
+    def __init__(self, mode="float", precision=DECIMAL_PRECISION):
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode}")
+        self.mode = mode
+        self.precision = precision
+
+    def divide(self, a, b):
+        """Divide a by b, None when b is zero"""
+        a = convert(a, self.mode)
+        b = convert(b, self.mode)
+        if b == 0:
+            return None
+        if self.mode == "decimal":
+            with localcontext() as ctx:
+                ctx.prec = self.precision
+                return a / b
+        try:
+            return a / b
+        except OverflowError:
+            # e.g. a 400 digit integer, too big for a float result
+            return self._decimal_divide(a, b)
+
+    def _decimal_divide(self, a, b):
+        with localcontext() as ctx:
+            ctx.prec = self.precision
+            ctx.Emax = MAX_EMAX
+            ctx.Emin = MIN_EMIN
+            return convert(a, "decimal") / convert(b, "decimal")
+
+    def remainder(self, a, b):
+        """Remainder of a divided by b, None when b is zero"""
+        a = convert(a, self.mode)
+        b = convert(b, self.mode)
+        if b == 0:
+            return None
+        if self.mode == "decimal":
+            return self._decimal_remainder(a, b)
+        return a % b
+
+    def _decimal_remainder(self, a, b):
+        if is_integral(a) and is_integral(b):
+            return Decimal(int(a) % int(b))
+        if not (a.is_finite() and b.is_finite()):
+            return None
+        with localcontext() as ctx:
+            # enough digits for the whole integer quotient, so % is exact
+            finest = min(a.as_tuple().exponent, b.as_tuple().exponent)
+            ctx.prec = max(self.precision, a.adjusted() - finest + 2)
+            ctx.Emax = MAX_EMAX
+            ctx.Emin = MIN_EMIN
+            result = a % b
+            # Decimal % truncates toward zero, match Python's floor modulo
+            if result and (result < 0) != (b < 0):
+                result += b
+            return result
+
+    def exponentiation(self, a, b, modulus=None):
+        """Raise a to the power b, exactly when both are integers"""
+        if modulus is not None:
+            if not (is_integral(a) and is_integral(b) and is_integral(modulus)):
+                return None
+            if int(modulus) == 0:
+                return None
+            try:
+                return pow(int(a), int(b), int(modulus))
+            except ValueError:
+                # negative exponent with no modular inverse
+                return None
+
+        if is_integral(a) and is_integral(b) and int(b) >= 0:
+            base, exp = int(a), int(b)
+            if abs(base) < 2 or exp * base.bit_length() <= MAX_EXACT_BITS:
+                return base ** exp
+            return self._decimal_power(base, exp)
+
+        a = convert(a, self.mode)
+        b = convert(b, self.mode)
+        if a == 0 and b < 0:
+            return None
+        if self.mode == "decimal":
+            return self._decimal_power(a, b)
+        try:
+            return a ** b
+        except OverflowError:
+            return self._decimal_power(a, b)
+
+    def _decimal_power(self, a, b):
+        with localcontext() as ctx:
+            ctx.prec = self.precision
+            ctx.Emax = MAX_EMAX
+            ctx.Emin = MIN_EMIN
+            try:
+                return convert(a, "decimal") ** convert(b, "decimal")
+            except DecimalException:
+                return None
+
+    def summation(self, a, b):
+        """Sum of the integers between a and b, None when b <= a or either is inf/nan"""
+        a = convert(a, self.mode)
+        b = convert(b, self.mode)
+        if not (is_finite(a) and is_finite(b)) or b <= a:
+            return None
+        return arithmetic_sum(int(a), int(b))
+
+
+def divide(a, b, mode="float"):
+    return CalculatorEngine(mode).divide(a, b)
+
+
+def exponentiation(a, b, modulus=None, mode="float"):
+    return CalculatorEngine(mode).exponentiation(a, b, modulus)
+
+
+def remainder(a, b, mode="float"):
+    return CalculatorEngine(mode).remainder(a, b)
+
+
+def summation(a, b):
+    return CalculatorEngine().summation(a, b)
@@ -1,3 +1,10 @@
+import os
+import sys
+
+# instrument.py sits in the repo root, one folder up
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instrument import timed, timer
+
 class Item:
     def __init__(self, item_id, name, description, price):
         self.item_id = item_id
@@ -12,6 +19,7 @@ class ItemManager:
     def __init__(self):
         self.items = {}
 
+    @timed("ItemManager.add_item")
     def add_item(self, item_id, name, description, price):
         try:
             if item_id in self.items:
@@ -19,10 +27,13 @@ class ItemManager:
             if price < 0:
                 raise ValueError("Price cannot be negative.")
             self.items[item_id] = Item(item_id, name, description, price)
-            print("Item added successfully.")
+            with timer("ItemManager.print"):
+                print("Item added successfully.")
         except ValueError as e:
-            print(f"Error: {e}")
+            with timer("ItemManager.print"):
+                print(f"Error: {e}")
 
+    @timed("ItemManager.update_item")
     def update_item(self, item_id, name=None, description=None, price=None):
         try:
             if item_id not in self.items:
@@ -37,25 +48,33 @@ class ItemManager:
                 item.description = description
             if price is not None:
                 item.price = price
-            print("Item updated successfully.")
+            with timer("ItemManager.print"):
+                print("Item updated successfully.")
         except ValueError as e:
-            print(f"Error: {e}")
+            with timer("ItemManager.print"):
+                print(f"Error: {e}")
 
+    @timed("ItemManager.delete_item")
     def delete_item(self, item_id):
         try:
             if item_id not in self.items:
                 raise ValueError("Item ID not found.")
             del self.items[item_id]
-            print("Item deleted successfully.")
+            with timer("ItemManager.print"):
+                print("Item deleted successfully.")
         except ValueError as e:
-            print(f"Error: {e}")
+            with timer("ItemManager.print"):
+                print(f"Error: {e}")
 
+    @timed("ItemManager.view_items")
     def view_items(self):
         if not self.items:
-            print("No items available.")
+            with timer("ItemManager.print"):
+                print("No items available.")
         else:
-            for item in self.items.values():
-                print(item)
+            with timer("ItemManager.print"):
+                for item in self.items.values():
+                    print(item)
 
 if __name__ == "__main__":
     manager = ItemManager()
@@ -0,0 +1,318 @@
+import argparse
+import builtins
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import generators
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline.json"
+SCALES = {"1k": 1_000, "100k": 100_000, "1M": 1_000_000}
+DEFAULT_SCALES = "1k,100k"
+THRESHOLD = 0.25
+# differences smaller than this are timer noise, never a regression
+MIN_DELTA = 0.001
+
+# name -> (setup function, largest size it runs at)
+BENCHMARKS = {}
+
+
+def benchmark(name, max_size=None):
+    """Register setup(size, workdir) -> zero-argument callable to time"""
+    def register(setup):
+        BENCHMARKS[name] = (setup, max_size)
+        return setup
+    return register
+
+
+@contextlib.contextmanager
+def quiet(answers=()):
+    """Answer input() prompts from a list and throw stdout away"""
+    answers = iter(answers)
+    with open(os.devnull, "w") as devnull, \
+            mock.patch.object(builtins, "input", lambda prompt="": next(answers)), \
+            contextlib.redirect_stdout(devnull):
+        yield
+
+
+@contextlib.contextmanager
+def working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def compile_script(relative_path):
+    path = ROOT / relative_path
+    return compile(path.read_text(encoding="utf-8"), str(path), "exec")
+
+
+def run_script(code, answers=(), cwd=None):
+    """Execute a compiled script as if it was imported, returning its globals"""
+    namespace = {"__name__": "bench", "__file__": code.co_filename}
+    with quiet(answers), working_directory(cwd or ROOT):
+        exec(code, namespace)
+    return namespace
+
+
+def mock_tkinter():
+    """Replace tkinter with mocks so PyPurr can be imported headless"""
+    tk = mock.MagicMock(name="tkinter")
+    for name in ("tkinter", "tkinter.messagebox", "tkinter.ttk", "tkinter.font"):
+        sys.modules[name] = getattr(tk, name.partition(".")[2]) if "." in name else tk
+
+
+def load_module(name, relative_path):
+    spec = importlib.util.spec_from_file_location(name, ROOT / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_pypurr = None
+
+
+def pypurr():
+    global _pypurr
+    if _pypurr is None:
+        mock_tkinter()
+        _pypurr = load_module("PyPurr", "PyPurr-Final/PyPurr.py")
+    return _pypurr
+
+
+# PyPurr RecordManager / RecordApp
+
+def record_manager(size, workdir):
+    manager = pypurr().RecordManager(os.path.join(workdir, "records.json"))
+    manager.save_records(generators.pypurr_records(size))
+    return manager
+
+
+@benchmark("pypurr.load_records")
+def bench_load_records(size, workdir):
+    return record_manager(size, workdir).load_records
+
+
+@benchmark("pypurr.save_records")
+def bench_save_records(size, workdir):
+    manager = record_manager(size, workdir)
+    records = manager.load_records()
+    return lambda: manager.save_records(records)
+
+
+@benchmark("pypurr.add_record_x10", max_size=100_000)
+def bench_add_record(size, workdir):
+    manager = record_manager(size, workdir)
+    new_records = generators.pypurr_records(10, seed=1)
+
+    def run():
+        for record in new_records:
+            manager.add_record(record)
+    return run
+
+
+@benchmark("pypurr.search_records")
+def bench_search_records(size, workdir):
+    manager = record_manager(size, workdir)
+    return lambda: manager.search_records("mar")
+
+
+@benchmark("pypurr.create_record_table", max_size=100_000)
+def bench_create_record_table(size, workdir):
+    app = object.__new__(pypurr().RecordApp)  # no window, just the method
+    records = generators.pypurr_records(size)
+    return lambda: app.create_record_table(mock.MagicMock(), records)
+
+
+# Activity 04 student record menu
+
+@benchmark("activity04.menu")
+def bench_activity04(size, workdir):
+    with open(os.path.join(workdir, "students.txt"), "w") as file:
+        file.writelines(generators.student_lines(size))
+    code = compile_script("Activity 04 List and Tuple/main.py")
+    # show all, order by last name, order by grade, save, exit
+    return lambda: run_script(code, ["1", "2", "3", "8", "9"], cwd=workdir)
+
+
+# act6 ItemManager
+
+@benchmark("act6.item_manager")
+def bench_item_manager(size, workdir):
+    namespace = run_script(compile_script("act6/py.py"))
+    items = generators.items(size)
+
+    def run():
+        manager = namespace["ItemManager"]()
+        with quiet():
+            for item in items:
+                manager.add_item(*item)
+            for item_id, name, description, price in items:
+                manager.update_item(item_id, price=price + 1)
+            manager.view_items()
+            for item_id, *_ in items:
+                manager.delete_item(item_id)
+    return run
+
+
+# act4b currency converter, act5 calculator
+
+@benchmark("act4b.currency_converter", max_size=100_000)
+def bench_currency(size, workdir):
+    code = compile_script("act4b/2.py")
+    codes = list(run_script(code, ["1", "EUR"])["currencies"])
+    conversions = generators.conversions(size, codes)
+
+    def run():
+        for amount, currency in conversions:
+            run_script(code, [str(amount), currency])
+    return run
+
+
+@benchmark("act5.summation")
+def bench_summation(size, workdir):
+    summation = run_script(compile_script("act5/try1.py"))["summation"]
+    return lambda: summation(1, size)
+
+
+@benchmark("act5.engine.summation")
+def bench_engine_summation(size, workdir):
+    sys.path.insert(0, str(ROOT / "act5"))
+    from engine import CalculatorEngine
+    engine = CalculatorEngine()
+    return lambda: engine.summation(1, size)
+
+
+# PE1 counterW
+
+@benchmark("pe1.counterW")
+def bench_counterw(size, workdir):
+    counterW = run_script(compile_script("PE1/PE1.py"), ["x"])["counterW"]
+    text = generators.statement(size)
+
+    def run():
+        with quiet():
+            counterW(text)
+    return run
+
+
+# TME palindrome checker
+
+@benchmark("tme.palindrome")
+def bench_palindrome(size, workdir):
+    with open(os.path.join(workdir, "numbers.txt"), "w") as file:
+        file.writelines(generators.number_lines(size))
+    code = compile_script("TME/MidtermProgram1.py")
+    return lambda: run_script(code, cwd=workdir)
+
+
+def run_benchmarks(scales, only=None, repeat=3, log=print):
+    results = {}
+    for name, (setup, max_size) in BENCHMARKS.items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        for label, size in scales.items():
+            key = f"{name}@{label}"
+            if max_size is not None and size > max_size:
+                log(f"{key:<38} skipped (max {max_size:,})")
+                continue
+            with tempfile.TemporaryDirectory() as workdir:
+                run = setup(size, workdir)
+                times = []
+                for _ in range(repeat if size < 1_000_000 else 1):
+                    start = time.perf_counter()
+                    run()
+                    times.append(time.perf_counter() - start)
+            results[key] = {"best": min(times), "mean": sum(times) / len(times), "runs": len(times)}
+            log(f"{key:<38} {min(times):10.6f}s")
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD, min_delta=MIN_DELTA):
+    """Lines describing each shared benchmark, and the keys that regressed"""
+    lines = []
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        old = baseline[key]["best"]
+        ratio = result["best"] / old if old else float("inf")
+        flag = ""
+        if ratio > 1 + threshold and result["best"] - old > min_delta:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        lines.append(f"{key:<38} {old:10.6f}s -> {result['best']:10.6f}s  x{ratio:5.2f}{flag}")
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the repo's hot paths headless")
+    parser.add_argument("--scales", default=DEFAULT_SCALES,
+                        help=f"comma separated from {', '.join(SCALES)}, or 'all' (default {DEFAULT_SCALES})")
+    parser.add_argument("--only", action="append", help="run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, best is kept (1M runs once)")
+    parser.add_argument("-o", "--output", help="write results as JSON here")
+    parser.add_argument("--baseline", default=str(BASELINE_FILE))
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="flag benchmarks slower than baseline by more than this fraction")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (_, max_size) in BENCHMARKS.items():
+            print(name if max_size is None else f"{name} (max {max_size:,})")
+        return 0
+
+    labels = list(SCALES) if args.scales == "all" else [s.strip() for s in args.scales.split(",")]
+    unknown = [label for label in labels if label not in SCALES]
+    if unknown:
+        parser.error(f"unknown scales: {', '.join(unknown)}")
+    scales = {label: SCALES[label] for label in labels}
+
+    results = run_benchmarks(scales, args.only, args.repeat)
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=4)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+    lines, regressions = compare(results, baseline, args.threshold)
+    print(f"\nCompared with {args.baseline}:")
+    for line in lines:
+        print(line)
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
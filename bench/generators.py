@@ -0,0 +1,56 @@
+import random
+
+FIRST_NAMES = ["omar", "john", "maria", "jose", "ana", "mark", "grace", "paolo", "bea", "carlo"]
+LAST_NAMES = ["francisco", "santos", "reyes", "cruz", "bautista", "garcia", "mendoza", "torres"]
+WORDS = ["the", "cat", "Dog", "and", "runs", "Python", "of", "fast", "a", "Record",
+         "sleeps", "or", "blue", "Manila", "code", "yet", "green", "Tree", "an", "jumps"]
+GENDERS = ["Male", "Female", "Other"]
+
+
+def pypurr_records(n, seed=0):
+    """PyPurr records.json entries"""
+    rng = random.Random(seed)
+    return [
+        {
+            "first_name": f"{rng.choice(FIRST_NAMES)}{i}",
+            "middle_name": rng.choice(LAST_NAMES),
+            "last_name": rng.choice(LAST_NAMES),
+            "birthday": f"{rng.randint(1990, 2010)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "gender": rng.choice(GENDERS),
+        }
+        for i in range(n)
+    ]
+
+
+def student_lines(n, seed=0):
+    """Activity 04 students.txt lines: id|first|last|class_standing|major_exam"""
+    rng = random.Random(seed)
+    return [
+        f"{100000 + i}|{rng.choice(FIRST_NAMES)}|{rng.choice(LAST_NAMES)}|"
+        f"{rng.uniform(60, 100):.1f}|{rng.uniform(60, 100):.1f}\n"
+        for i in range(n)
+    ]
+
+
+def number_lines(n, seed=0):
+    """TME numbers.txt lines of comma-separated integers"""
+    rng = random.Random(seed)
+    return [",".join(str(rng.randint(0, 999)) for _ in range(rng.randint(2, 6))) + "\n" for _ in range(n)]
+
+
+def statement(n, seed=0):
+    """A counterW input of n words"""
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def items(n, seed=0):
+    """(item_id, name, description, price) tuples for ItemManager"""
+    rng = random.Random(seed)
+    return [(i, f"item{i}", rng.choice(WORDS), round(rng.uniform(1, 500), 2)) for i in range(n)]
+
+
+def conversions(n, codes, seed=0):
+    """(amount, currency code) pairs for the currency converter"""
+    rng = random.Random(seed)
+    return [(round(rng.uniform(1, 1000), 2), rng.choice(codes)) for _ in range(n)]
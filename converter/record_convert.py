@@ -0,0 +1,267 @@
+import argparse
+import json
+import re
+import sys
+import time
+
+# Every field any of the formats knows about
+FIELDS = (
+    "student_id", "first_name", "middle_name", "last_name", "birthday", "gender",
+    "age", "contact_number", "course", "class_standing", "major_exam",
+)
+READ_SIZE = 1024 * 1024
+# a decode error this close to the end of the buffer may just be a record cut in half
+MAX_PARTIAL = 16
+TFA2_LINE = re.compile(
+    r"Name = (?P<last_name>.*?) \+ (?P<first_name>.*?),\s*Age= ?(?P<age>[^,]*),\s*"
+    r"Contact: ?(?P<contact_number>[^,]*),\s*(?:John )?Course: ?(?P<course>.*)"
+)
+
+
+class Stats:
+    def __init__(self):
+        self.records = 0
+        self.skipped = 0
+        self.bytes_in = 0
+        self.started = time.perf_counter()
+
+    def report(self):
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return (f"{self.records} records ({self.skipped} skipped) in {elapsed:.3f}s: "
+                f"{self.records / elapsed:,.0f} records/s, {self.bytes_in / elapsed / 1024 / 1024:.1f} MB/s")
+
+
+def text_bytes(text):
+    """UTF-8 size of text, without encoding it when it is plain ASCII"""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def read_lines(file, stats):
+    for line in file:
+        stats.bytes_in += text_bytes(line)
+        line = line.strip()
+        if line:
+            yield line
+
+
+# Parsers: text file -> raw records (dicts with some of FIELDS)
+
+def parse_pypurr_json(file, stats):
+    """Stream the objects of a JSON array (PyPurr's records.json) one at a time"""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    started = False
+    eof = False
+    while True:
+        # skip whitespace, '[' and ',' between objects
+        while position < len(buffer) and buffer[position] in " \t\r\n,[":
+            if buffer[position] == "[":
+                started = True
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        if position < len(buffer):
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as e:
+                # only read more when more data could fix it, never the rest of a broken file
+                truncated = e.msg.startswith("Unterminated string") or len(buffer) - e.pos <= MAX_PARTIAL
+                if eof or not truncated:
+                    raise
+            else:
+                if not started:
+                    raise ValueError("Expected a JSON array of records")
+                position = end
+                yield record
+                continue
+        if eof:
+            return
+        chunk = file.read(READ_SIZE)
+        stats.bytes_in += text_bytes(chunk)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+def parse_records_txt(file, stats):
+    """first,middle,last,birthday,gender per line"""
+    for line in read_lines(file, stats):
+        data = line.split(",")
+        if len(data) != 5:
+            stats.skipped += 1
+            continue
+        yield dict(zip(("first_name", "middle_name", "last_name", "birthday", "gender"), data))
+
+
+def parse_students_pipe(file, stats):
+    """Activity 04's id|first|last|class_standing|major_exam per line"""
+    for line in read_lines(file, stats):
+        data = line.split("|")
+        if len(data) != 5:
+            stats.skipped += 1
+            continue
+        try:
+            yield {
+                "student_id": data[0],
+                "first_name": data[1],
+                "last_name": data[2],
+                "class_standing": float(data[3]),
+                "major_exam": float(data[4]),
+            }
+        except ValueError:
+            stats.skipped += 1
+
+
+def parse_tfa2_text(file, stats):
+    """TFA2 3.3's 'Name = Last + First,  Age= .., Contact: .., Course: ..' lines"""
+    for line in read_lines(file, stats):
+        match = TFA2_LINE.match(line)
+        if not match:
+            stats.skipped += 1
+            continue
+        yield match.groupdict()
+
+
+def parse_jsonl(file, stats):
+    for line in read_lines(file, stats):
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            stats.skipped += 1
+
+
+# Normalize: raw record -> dict with every field, "" for unknown ones
+
+def to_number(value, kind):
+    if value in ("", None):
+        return ""
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def normalize(record):
+    normalized = {field: record.get(field, "") for field in FIELDS}
+    for field, value in normalized.items():
+        if isinstance(value, str):
+            normalized[field] = value.strip()
+    normalized["age"] = to_number(normalized["age"], int)
+    normalized["class_standing"] = to_number(normalized["class_standing"], float)
+    normalized["major_exam"] = to_number(normalized["major_exam"], float)
+    return normalized
+
+
+# Serializers: normalized records -> chunks of output text
+
+def write_pypurr_json(records):
+    """Same layout as json.dump(records, file, indent=4), one record at a time"""
+    keys = ("first_name", "middle_name", "last_name", "birthday", "gender")
+    first = True
+    for record in records:
+        item = json.dumps({key: record[key] for key in keys}, indent=4)
+        yield ("[\n    " if first else ",\n    ") + item.replace("\n", "\n    ")
+        first = False
+    yield "[]" if first else "\n]"
+
+
+def write_records_txt(records):
+    for r in records:
+        yield f"{r['first_name']},{r['middle_name']},{r['last_name']},{r['birthday']},{r['gender']}\n"
+
+
+def write_students_pipe(records):
+    for r in records:
+        # Activity 04 expects floats for the grades
+        class_standing = r["class_standing"] if r["class_standing"] != "" else 0.0
+        major_exam = r["major_exam"] if r["major_exam"] != "" else 0.0
+        yield f"{r['student_id']}|{r['first_name']}|{r['last_name']}|{class_standing}|{major_exam}\n"
+
+
+def write_tfa2_text(records):
+    for r in records:
+        yield (f"Name = {r['last_name']} + {r['first_name']},  Age= {r['age']}, "
+               f"Contact: {r['contact_number']}, Course: {r['course']}\n")
+
+
+def write_jsonl(records):
+    for r in records:
+        yield json.dumps({key: value for key, value in r.items() if value != ""}, ensure_ascii=False) + "\n"
+
+
+FORMATS = {
+    "pypurr-json": (parse_pypurr_json, write_pypurr_json),
+    "records-txt": (parse_records_txt, write_records_txt),
+    "students-pipe": (parse_students_pipe, write_students_pipe),
+    "tfa2-text": (parse_tfa2_text, write_tfa2_text),
+    "jsonl": (parse_jsonl, write_jsonl),
+}
+
+
+def convert(source, target, from_format, to_format, stats=None, buffer_size=64 * 1024):
+    """Transcode source to target one record at a time; returns the Stats"""
+    stats = stats or Stats()
+    parse = FORMATS[from_format][0]
+    serialize = FORMATS[to_format][1]
+
+    def counted(records):
+        for record in records:
+            if not isinstance(record, dict):
+                stats.skipped += 1
+                continue
+            stats.records += 1
+            yield normalize(record)
+
+    pending = []
+    pending_size = 0
+    for text in serialize(counted(parse(source, stats))):
+        pending.append(text)
+        pending_size += len(text)
+        if pending_size >= buffer_size:
+            target.write("".join(pending))
+            pending = []
+            pending_size = 0
+    target.write("".join(pending))
+    return stats
+
+
+def guess_format(filename):
+    if filename.endswith(".jsonl"):
+        return "jsonl"
+    if filename.endswith(".json"):
+        return "pypurr-json"
+    if filename.endswith("records.txt"):
+        return "records-txt"
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert person/student records between this repo's formats")
+    parser.add_argument("input", help="input file, or - for stdin")
+    parser.add_argument("output", help="output file, or - for stdout")
+    parser.add_argument("-f", "--from", dest="from_format", choices=sorted(FORMATS))
+    parser.add_argument("-t", "--to", dest="to_format", choices=sorted(FORMATS))
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print throughput")
+    args = parser.parse_args(argv)
+
+    from_format = args.from_format or guess_format(args.input)
+    to_format = args.to_format or guess_format(args.output)
+    if from_format is None or to_format is None:
+        parser.error("cannot tell the format from the file name, use --from/--to")
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        stats = convert(source, target, from_format, to_format)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    if not args.quiet:
+        print(stats.report(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
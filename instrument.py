@@ -0,0 +1,260 @@
+"""Opt-in timing for PyPurr's RecordManager/RecordApp and act6's ItemManager
+
+Those classes mark their methods with @timed and their JSON, Treeview and
+print work with timer blocks. Both do nothing unless timing is switched
+on, either by running the program through this file:
+
+    python instrument.py PyPurr-Final/PyPurr.py
+    python instrument.py --profile -o perf.json act6/py.py
+
+or by setting PERF_INSTRUMENT=1 (PERF_PROFILE=1 adds the sampling
+profiler, PERF_REPORT names the report).
+When the program exits a JSON report (call counts, total/self time and
+p50/p95/p99 per operation, counters, optional sampling profile) is
+written and a summary is printed to stderr.
+"""
+import argparse
+import atexit
+import collections
+import functools
+import json
+import os
+import random
+import runpy
+import sys
+import threading
+import time
+
+MAX_SAMPLES = 100_000
+REPORT_FILE = "perf_report.json"
+
+
+class Histogram:
+    """Durations of one operation, reservoir-sampled once it gets big"""
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.count = 0
+        self.total = 0.0
+        self.self_total = 0.0
+        self.max = 0.0
+        self.samples = []
+        self.max_samples = max_samples
+
+    def add(self, duration, self_time):
+        self.count += 1
+        self.total += duration
+        self.self_total += self_time
+        if duration > self.max:
+            self.max = duration
+        if len(self.samples) < self.max_samples:
+            self.samples.append(duration)
+        else:
+            slot = random.randrange(self.count)
+            if slot < self.max_samples:
+                self.samples[slot] = duration
+
+    def summary(self):
+        ordered = sorted(self.samples)
+
+        def pick(p):
+            return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] if ordered else 0.0
+
+        return {
+            "count": self.count,
+            "total": self.total,
+            "self": self.self_total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": pick(50),
+            "p95": pick(95),
+            "p99": pick(99),
+            "max": self.max,
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self.enabled = False
+        self.histograms = collections.defaultdict(Histogram)
+        self.counters = collections.Counter()
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def record(self, name, duration, self_time):
+        with self.lock:
+            self.histograms[name].add(duration, self_time)
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] += n
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "timings": {name: h.summary() for name, h in sorted(self.histograms.items())},
+                "counters": dict(self.counters),
+            }
+
+
+METRICS = Metrics()
+
+
+class timer:
+    """Time a block (nested timers are subtracted from the outer block's self time)"""
+
+    __slots__ = ("name", "start", "child_time")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if METRICS.enabled:
+            stack = getattr(METRICS.local, "stack", None)
+            if stack is None:
+                stack = METRICS.local.stack = []
+            stack.append(self)
+            self.child_time = 0.0
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if METRICS.enabled:
+            duration = time.perf_counter() - self.start
+            stack = METRICS.local.stack
+            stack.pop()
+            if stack:
+                stack[-1].child_time += duration
+            METRICS.record(self.name, duration, duration - self.child_time)
+            if exc_type is not None:
+                METRICS.count(f"{self.name}.errors")
+
+
+def timed(name):
+    """Decorator version of timer; the function is returned untouched when disabled"""
+    def decorate(func):
+        if not METRICS.enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class SamplingProfiler:
+    """Sample one thread's stack every interval seconds from a background thread"""
+
+    def __init__(self, interval=0.005, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.own = collections.Counter()
+        self.cumulative = collections.Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.samples += 1
+            self.own[self._label(frame)] += 1
+            seen = set()
+            while frame is not None:
+                label = self._label(frame)
+                if label not in seen:
+                    self.cumulative[label] += 1
+                    seen.add(label)
+                frame = frame.f_back
+
+    @staticmethod
+    def _label(frame):
+        code = frame.f_code
+        return f"{os.path.basename(code.co_filename)}:{code.co_firstlineno}({code.co_name})"
+
+    def report(self, top=30):
+        return {
+            "interval": self.interval,
+            "samples": self.samples,
+            "own": self.own.most_common(top),
+            "cumulative": self.cumulative.most_common(top),
+        }
+
+
+def format_summary(report):
+    lines = [f"{'operation':<34} {'calls':>8} {'total s':>10} {'self s':>10} "
+             f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+    for name, t in report["timings"].items():
+        lines.append(f"{name:<34} {t['count']:>8} {t['total']:>10.4f} {t['self']:>10.4f} "
+                     f"{t['p50'] * 1000:>9.3f} {t['p95'] * 1000:>9.3f} {t['p99'] * 1000:>9.3f}")
+    for name, n in sorted(report["counters"].items()):
+        lines.append(f"{name:<34} {n:>8}")
+    profile = report.get("profile")
+    if profile:
+        lines.append(f"\nSampling profile ({profile['samples']} samples, own time):")
+        for label, n in profile["own"][:10]:
+            lines.append(f"  {n:>6}  {label}")
+    return "\n".join(lines)
+
+
+def dump(filename, profiler=None):
+    report = METRICS.snapshot()
+    if profiler is not None:
+        profiler.stop()
+        report["profile"] = profiler.report()
+    with open(filename, "w") as file:
+        json.dump(report, file, indent=4)
+    print(format_summary(report), file=sys.stderr)
+    print(f"Performance report written to {filename}", file=sys.stderr)
+
+
+def enable(output=REPORT_FILE, profile=False, interval=0.005):
+    """Switch timing on and write the report when the program exits
+
+    Call it before the instrumented classes are defined: @timed decides
+    when the class body runs whether to wrap a method.
+    """
+    METRICS.enabled = True
+    profiler = SamplingProfiler(interval).start() if profile else None
+    atexit.register(dump, os.path.abspath(output), profiler)
+
+
+def switched_on(name):
+    return os.environ.get(name, "") not in ("", "0")
+
+
+if __name__ != "__main__" and switched_on("PERF_INSTRUMENT"):
+    enable(os.environ.get("PERF_REPORT", REPORT_FILE), switched_on("PERF_PROFILE"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a program with timing instrumentation")
+    parser.add_argument("-o", "--output", default=os.environ.get("PERF_REPORT", REPORT_FILE))
+    parser.add_argument("--profile", action="store_true", help="also run the sampling profiler")
+    parser.add_argument("--interval", type=float, default=0.005, help="profiler sampling interval (s)")
+    parser.add_argument("script")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    # the script's "from instrument import ..." must get this module, not a second copy
+    sys.modules.setdefault("instrument", sys.modules[__name__])
+    enable(args.output, args.profile, args.interval)
+
+    sys.argv = [args.script] + args.args
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    runpy.run_path(args.script, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()